@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, File, UploadFile, Form, BackgroundTasks, Depends, Header
+from fastapi import FastAPI, HTTPException, File, UploadFile, Form, BackgroundTasks, Depends, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from google.cloud import storage, firestore
@@ -6,7 +6,7 @@ from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 from pydantic import BaseModel
 from typing import Optional, Dict, List
-import json, uuid, datetime, asyncio
+import json, uuid, datetime, asyncio, hashlib, base64
 import zipfile, tempfile, os
 
 app = FastAPI(title="Vajra Serverless Platform", version="3.0.0")
@@ -30,6 +30,10 @@ storage_client = storage.Client()
 # Initialize global memory store per user
 functions_memory_store = {}  # {user_id: {function_name: function_data}}
 
+# Recent deploy responses by (user_id, Idempotency-Key) so retried uploads are not redeployed
+deploy_responses = {}
+DEPLOY_RESPONSES_MAX = 256
+
 # Authentication functions
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify Google OAuth token and return user info"""
@@ -134,6 +138,13 @@ class InvokeRequest(BaseModel):
     async_mode: Optional[bool] = False
     trace_id: Optional[str] = None
 
+class BatchGetRequest(BaseModel):
+    names: List[str]
+    fields: Optional[List[str]] = None
+
+class UploadUrlRequest(BaseModel):
+    content_md5: str
+
 class DeploymentConfig(BaseModel):
     blue_green: Optional[bool] = False
     canary_percent: Optional[int] = 0
@@ -159,6 +170,7 @@ async def get_oauth_url():
         
         return {
             "oauth_url": oauth_url,
+            "client_id": GOOGLE_CLIENT_ID,
             "state": state,
             "instructions": "Open this URL in your browser to authenticate"
         }
@@ -166,19 +178,27 @@ async def get_oauth_url():
         raise HTTPException(500, f"OAuth URL generation failed: {str(e)}")
 
 @app.get("/auth/oauth/callback")
-async def oauth_callback(code: str, state: str):
+async def oauth_callback(code: str, state: str, code_verifier: Optional[str] = None,
+                         redirect_uri: Optional[str] = None):
     """Handle OAuth callback"""
     try:
         # Exchange authorization code for access token
         import requests as req
         token_url = "https://oauth2.googleapis.com/token"
+        # The CLI may listen on another loopback port when 8080 is taken
+        if not (redirect_uri and redirect_uri.startswith("http://localhost:")
+                and redirect_uri.endswith("/callback")):
+            redirect_uri = "http://localhost:8080/callback"
         token_data = {
             "client_id": GOOGLE_CLIENT_ID,
             "client_secret": GOOGLE_CLIENT_SECRET,
             "code": code,
             "grant_type": "authorization_code",
-            "redirect_uri": "http://localhost:8080/callback"
+            "redirect_uri": redirect_uri
         }
+        # CLIs that build the auth URL themselves complete PKCE here
+        if code_verifier:
+            token_data["code_verifier"] = code_verifier
         
         token_response = req.post(token_url, data=token_data)
         
@@ -272,24 +292,58 @@ async def create_function(
     timeout: int = Form(30),
     description: str = Form(""),
     environment: str = Form("{}"),
-    code: UploadFile = File()
+    code: Optional[UploadFile] = File(None),
+    artifact_sha256: Optional[str] = Form(None),
+    idempotency_key: Optional[str] = Header(None)
 ):
     if runtime not in RUNTIMES:
         raise HTTPException(400, f"Unsupported runtime: {runtime}")
+    if code is None and not artifact_sha256:
+        raise HTTPException(400, "Either code or artifact_sha256 is required")
+    if artifact_sha256 and (len(artifact_sha256) != 64 or
+                            any(c not in "0123456789abcdef" for c in artifact_sha256)):
+        raise HTTPException(400, "artifact_sha256 must be a lowercase hex SHA-256 digest")
     
     function_id = str(uuid.uuid4())
     version = 1
     user_id = user["user_id"]
     
+    # A retried upload of the same package gets the original response
+    if idempotency_key and (user_id, idempotency_key) in deploy_responses:
+        return deploy_responses[(user_id, idempotency_key)]
+    
     try:
         # Parse environment variables
         env_vars = json.loads(environment) if environment else {}
         
-        # Store function code in user-specific path
+        # Store function code in user-specific path; packages are also kept by
+        # content hash so an unchanged bundle can be redeployed without re-uploading
         bucket = storage_client.bucket("vajra-functions-f765d09f3196bb52")
-        blob = bucket.blob(f"users/{user_id}/{name}/v{version}/{function_id}.zip")
-        content = await code.read()
-        blob.upload_from_string(content)
+        blob_path = f"users/{user_id}/{name}/v{version}/{function_id}.zip"
+        if code is not None:
+            content = await code.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if artifact_sha256 and artifact_sha256 != digest:
+                raise HTTPException(400, "Package does not match artifact_sha256")
+            blob = bucket.blob(blob_path)
+            blob.upload_from_string(content)
+            artifact = bucket.blob(f"artifacts/{user_id}/{digest}.zip")
+            if not artifact.exists():
+                artifact = bucket.copy_blob(blob, bucket, artifact.name)
+                artifact.metadata = {"sha256": digest}
+                artifact.patch()
+        else:
+            artifact = bucket.get_blob(f"artifacts/{user_id}/{artifact_sha256}.zip")
+            if artifact is None:
+                raise HTTPException(404, "Artifact not found")
+            # Signed-URL uploads only bind Content-MD5, so hash the object once before trusting its name
+            if (artifact.metadata or {}).get("sha256") != artifact_sha256:
+                if hashlib.sha256(artifact.download_as_bytes()).hexdigest() != artifact_sha256:
+                    artifact.delete()
+                    raise HTTPException(400, "Artifact does not match artifact_sha256")
+                artifact.metadata = {**(artifact.metadata or {}), "sha256": artifact_sha256}
+                artifact.patch()
+            bucket.copy_blob(artifact, bucket, blob_path)
         
         # Store metadata
         function_data = {
@@ -335,16 +389,69 @@ async def create_function(
         # Deploy in background
         background_tasks.add_task(deploy_function_runtime, name, function_data)
         
-        return {
+        result = {
             "function_id": function_id,
             "name": name,
             "status": "deploying",
             "version": version
         }
+        if idempotency_key:
+            if len(deploy_responses) >= DEPLOY_RESPONSES_MAX:
+                deploy_responses.pop(next(iter(deploy_responses)))
+            deploy_responses[(user_id, idempotency_key)] = result
+        return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(500, f"Deployment failed: {str(e)}")
 
+@app.head("/artifacts/{digest}")
+async def head_artifact(digest: str, user: dict = Depends(verify_token)):
+    bucket = storage_client.bucket("vajra-functions-f765d09f3196bb52")
+    if not bucket.blob(f"artifacts/{user['user_id']}/{digest}.zip").exists():
+        raise HTTPException(404, "Artifact not found")
+    return Response(status_code=200)
+
+@app.post("/artifacts/{digest}/upload-url")
+async def create_artifact_upload_url(digest: str, request: UploadUrlRequest, user: dict = Depends(verify_token)):
+    """Signed URL for PUTting a package straight to storage, so its bytes never pass through the gateway"""
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise HTTPException(400, "digest must be a lowercase hex SHA-256 digest")
+    try:
+        if len(base64.b64decode(request.content_md5, validate=True)) != 16:
+            raise ValueError
+    except ValueError:
+        raise HTTPException(400, "content_md5 must be a base64 MD5 digest")
+    
+    bucket = storage_client.bucket("vajra-functions-f765d09f3196bb52")
+    blob = bucket.blob(f"artifacts/{user['user_id']}/{digest}.zip")
+    # Storage rejects the PUT unless the body matches the signed Content-MD5
+    signing = {
+        "version": "v4",
+        "expiration": datetime.timedelta(minutes=15),
+        "method": "PUT",
+        "content_type": "application/zip",
+        "content_md5": request.content_md5
+    }
+    try:
+        try:
+            upload_url = blob.generate_signed_url(**signing)
+        except AttributeError:
+            # Cloud Run credentials hold no private key, so sign through the IAM API instead
+            credentials = storage_client._credentials
+            credentials.refresh(google_requests.Request())
+            upload_url = blob.generate_signed_url(
+                service_account_email=credentials.service_account_email,
+                access_token=credentials.token,
+                **signing
+            )
+    except Exception as e:
+        print(f"[WARN] Cannot sign artifact upload URLs: {e}")
+        raise HTTPException(501, "Direct uploads are not available")
+    
+    return {"upload_url": upload_url, "expires_in": 900}
+
 async def deploy_function_runtime(name: str, function_data: dict):
     """Deploy function to Cloud Run with custom runtime"""
     user_id = function_data.get("user_id")
@@ -428,7 +535,7 @@ async def list_functions(user: dict = Depends(verify_token)):
     }
 
 @app.get("/functions/{name}")
-async def get_function(name: str, user: dict = Depends(verify_token)):
+async def get_function(name: str, fields: Optional[str] = None, user: dict = Depends(verify_token)):
     function_data = None
     user_id = user["user_id"]
     
@@ -449,17 +556,46 @@ async def get_function(name: str, user: dict = Depends(verify_token)):
     if not function_data:
         raise HTTPException(404, "Function not found")
     
-    # Get recent logs
-    logs = get_function_logs(name, limit=10)
+    return function_details(name, function_data, fields.split(",") if fields else None)
+
+def function_details(name: str, function_data: dict, fields: Optional[List[str]] = None):
+    """Function record plus recent logs and metrics, limited to the requested fields"""
+    result = {"function": function_data}
+    if fields is None or "logs" in fields:
+        result["logs"] = get_function_logs(name, limit=10)
+    if fields is None or "metrics" in fields:
+        result["metrics"] = get_function_metrics(name)
+    return result
+
+@app.post("/functions:batchGet")
+async def batch_get_functions(request: BatchGetRequest, user: dict = Depends(verify_token)):
+    if len(request.names) > 50:
+        raise HTTPException(400, "At most 50 functions per batch")
     
-    # Get metrics
-    metrics = get_function_metrics(name)
+    user_id = user["user_id"]
+    found = {}
     
-    return {
-        "function": function_data,
-        "logs": logs,
-        "metrics": metrics
-    }
+    # One Firestore round trip for every requested document
+    if db and request.names:
+        try:
+            collection = db.collection(get_user_collection(user_id))
+            for doc in db.get_all([collection.document(name) for name in request.names]):
+                if doc.exists:
+                    found[doc.id] = doc.to_dict()
+        except Exception as e:
+            print(f"Error batch getting functions from Firestore: {e}")
+    
+    # Fallback to memory store
+    user_functions = functions_memory_store.get(user_id, {})
+    functions, missing = [], []
+    for name in request.names:
+        function_data = found.get(name) or user_functions.get(name)
+        if not function_data:
+            missing.append(name)
+            continue
+        functions.append(function_details(name, function_data, request.fields))
+    
+    return {"functions": functions, "missing": missing}
 
 @app.post("/functions/{name}/invoke")
 async def invoke_function(name: str, request: InvokeRequest, user: dict = Depends(verify_token)):
@@ -5,12 +5,15 @@ A Lambda-like platform optimized for LLM inference and fine-tuning on GCP.
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, List, Any
 import uuid
+import json
 import datetime
 import asyncio
 import random
+import time
 
 app = FastAPI(
     title="VAJRA LLM Platform",
@@ -284,6 +287,7 @@ class ChatRequest(BaseModel):
     adapter: Optional[str] = None
     max_tokens: Optional[int] = 512
     temperature: Optional[float] = 0.7
+    stream: Optional[bool] = False
 
 class DeployModelRequest(BaseModel):
     model_id: str
@@ -432,9 +436,27 @@ async def create_chat_completion(request: ChatRequest):
         response = f"I've analyzed your request regarding '{user_message[:50]}'. Here are my thoughts and recommendations based on the context provided."
     
     tokens = len(response.split()) * 1.3
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    usage = {
+        "prompt_tokens": sum(len(m.content.split()) for m in request.messages),
+        "completion_tokens": int(tokens),
+        "total_tokens": sum(len(m.content.split()) for m in request.messages) + int(tokens)
+    }
+    meta = {
+        "cold_start": False,
+        "latency_ms": random.randint(100, 300),
+        "gpu_type": model["gpu_type"],
+        "cost": round(usage["total_tokens"] * model["cost_per_1k_tokens"] / 1000, 6)
+    }
+    
+    if request.stream:
+        return StreamingResponse(
+            stream_chat_completion(completion_id, request, response, usage, meta),
+            media_type="text/event-stream"
+        )
     
     return {
-        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "id": completion_id,
         "object": "chat.completion",
         "created": int(datetime.datetime.utcnow().timestamp()),
         "model": request.model,
@@ -449,17 +471,42 @@ async def create_chat_completion(request: ChatRequest):
                 "finish_reason": "stop"
             }
         ],
-        "usage": {
-            "prompt_tokens": sum(len(m.content.split()) for m in request.messages),
-            "completion_tokens": int(tokens),
-            "total_tokens": sum(len(m.content.split()) for m in request.messages) + int(tokens)
-        },
-        "meta": {
-            "cold_start": False,
-            "latency_ms": random.randint(100, 300),
-            "gpu_type": model["gpu_type"]
+        "usage": usage,
+        "meta": meta
+    }
+
+async def stream_chat_completion(completion_id: str, request: ChatRequest, content: str, usage: dict, meta: dict):
+    """Server-sent chat.completion.chunk events, one word at a time; usage rides on the last chunk"""
+    created = int(datetime.datetime.utcnow().timestamp())
+    words = content.split(" ")
+    for i, word in enumerate(words):
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": request.model,
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": word if i == 0 else " " + word},
+                    "finish_reason": None
+                }
+            ]
         }
+        yield f"data: {json.dumps(chunk)}\n\n"
+        await asyncio.sleep(0.02)
+    
+    final = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": request.model,
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        "usage": usage,
+        "meta": meta
     }
+    yield f"data: {json.dumps(final)}\n\n"
+    yield "data: [DONE]\n\n"
 
 # ============================================================================
 # MODEL MANAGEMENT
@@ -633,21 +680,50 @@ async def delete_adapter(adapter_id: str):
 # FINE-TUNING JOBS
 # ============================================================================
 
+# Jobs created through the API, by ID, with when they were created; their progress is simulated from it
+CREATED_JOBS: Dict[str, float] = {}
+JOB_QUEUE_SECONDS = 5
+JOB_EPOCH_SECONDS = 20
+
+def advance_job(job: dict) -> dict:
+    """Move a created job from queued through running to completed as time passes"""
+    created = CREATED_JOBS.get(job["id"])
+    if created is None or job["status"] in ("completed", "failed", "cancelled"):
+        return job
+    
+    elapsed = time.time() - created - JOB_QUEUE_SECONDS
+    if elapsed >= 0:
+        progress = min(1.0, elapsed / (JOB_EPOCH_SECONDS * job["total_epochs"]))
+        job["status"] = "completed" if progress >= 1 else "running"
+        job["progress"] = round(progress, 2)
+        job["epochs_completed"] = int(progress * job["total_epochs"])
+    return job
+
 @app.get("/v1/fine-tuning/jobs")
 async def list_fine_tuning_jobs(
     status: Optional[str] = None,
-    limit: int = Query(10, le=100)
+    limit: int = Query(10, le=100),
+    cursor: Optional[str] = None
 ):
-    """List fine-tuning jobs"""
-    jobs = MOCK_JOBS
+    """List fine-tuning jobs a page at a time; pass next_cursor back as cursor for the next page"""
+    jobs = [advance_job(j) for j in MOCK_JOBS]
     
     if status:
         jobs = [j for j in jobs if j["status"] == status]
     
+    # The cursor is the ID of the last job on the previous page
+    start = 0
+    if cursor:
+        start = next((i + 1 for i, j in enumerate(jobs) if j["id"] == cursor), None)
+        if start is None:
+            raise HTTPException(400, f"Invalid cursor '{cursor}'")
+    page = jobs[start:start + limit]
+    
     return {
         "object": "list",
-        "data": jobs[:limit],
-        "total": len(jobs)
+        "data": page,
+        "total": len(jobs),
+        "next_cursor": page[-1]["id"] if page and start + limit < len(jobs) else None
     }
 
 @app.get("/v1/fine-tuning/jobs/{job_id}")
@@ -657,6 +733,7 @@ async def get_fine_tuning_job(job_id: str):
     
     if not job:
         raise HTTPException(404, f"Job '{job_id}' not found")
+    advance_job(job)
     
     return {
         "job": job,
@@ -673,6 +750,24 @@ async def get_fine_tuning_job(job_id: str):
 async def create_fine_tuning_job(request: FineTuneRequest):
     """Create a new fine-tuning job"""
     job_id = f"job_ft_{uuid.uuid4().hex[:6]}"
+    model = MOCK_MODELS.get(request.base_model, {})
+    created_at = datetime.datetime.utcnow().isoformat()
+    
+    # Keep the job so it can be listed and polled like the existing ones
+    MOCK_JOBS.append({
+        "id": job_id,
+        "type": "fine-tuning",
+        "model": request.base_model,
+        "adapter_name": request.adapter_name,
+        "status": "queued",
+        "progress": 0,
+        "gpu_type": model.get("gpu_type", "A100-40GB"),
+        "gpu_count": model.get("gpu_count", 1),
+        "epochs_completed": 0,
+        "total_epochs": request.epochs,
+        "created_at": created_at
+    })
+    CREATED_JOBS[job_id] = time.time()
     
     return {
         "id": job_id,
@@ -689,12 +784,16 @@ async def create_fine_tuning_job(request: FineTuneRequest):
         },
         "estimated_cost": round(random.uniform(15, 50), 2),
         "estimated_duration": "2-4 hours",
-        "created_at": datetime.datetime.utcnow().isoformat()
+        "created_at": created_at
     }
 
 @app.post("/v1/fine-tuning/jobs/{job_id}/cancel")
 async def cancel_fine_tuning_job(job_id: str):
     """Cancel a fine-tuning job"""
+    job = next((j for j in MOCK_JOBS if j["id"] == job_id), None)
+    if job and advance_job(job)["status"] not in ("completed", "failed"):
+        job["status"] = "cancelled"
+    
     return {
         "id": job_id,
         "status": "cancelled",
@@ -856,6 +955,23 @@ async def get_metrics():
         }
     }
 
+# ============================================================================
+# OVERVIEW
+# ============================================================================
+
+@app.get("/v1/overview")
+async def get_overview():
+    """Every dashboard view in one response, keyed like the CLI commands"""
+    return {
+        "models": await list_models(),
+        "adapters": await list_adapters(),
+        "gpu": await list_gpu_pools(),
+        # The first page the CLI's jobs command requests, so both views agree
+        "jobs": await list_fine_tuning_jobs(status=None, limit=50, cursor=None),
+        "usage": await get_usage(start_date=None, end_date=None),
+        "metrics": await get_metrics()
+    }
+
 # ============================================================================
 # MAIN
 # ============================================================================
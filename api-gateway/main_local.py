@@ -7,15 +7,30 @@ from fastapi import FastAPI, HTTPException, File, UploadFile, Form, BackgroundTa
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, Dict, List
+from contextlib import asynccontextmanager
 import json
-import uuid
 import datetime
 import asyncio
 import os
 import tempfile
 import zipfile
 
-app = FastAPI(title="Vajra Serverless Platform (Local)", version="3.0.0-local")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    consumer = asyncio.create_task(consume_logs())
+    yield
+    consumer.cancel()
+    try:
+        await consumer
+    except asyncio.CancelledError:
+        pass
+    # Keep entries queued after the last batch instead of dropping them
+    batch = []
+    while not _log_q.empty():
+        batch.append(_log_q.get_nowait())
+    store_logs(batch)
+
+app = FastAPI(title="Vajra Serverless Platform (Local)", version="3.0.0-local", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +45,10 @@ functions_store: Dict[str, dict] = {}
 function_versions: Dict[str, list] = {}
 function_logs: Dict[str, list] = {}
 
+# Log entries are queued by add_log and drained in batches by a single consumer
+_log_q: asyncio.Queue = asyncio.Queue()
+LOG_BATCH_SIZE = 64
+
 # Runtime configurations
 RUNTIMES = {
     "python3.8": {"image": "python:3.8-slim", "cmd": ["python", "main.py"], "ext": ".py"},
@@ -103,7 +122,7 @@ async def create_function(
     if name in functions_store:
         raise HTTPException(400, f"Function '{name}' already exists. Use PUT to update.")
     
-    function_id = str(uuid.uuid4())
+    function_id = os.urandom(16).hex()
     
     try:
         env_vars = json.loads(environment) if environment else {}
@@ -131,7 +150,9 @@ async def create_function(
         "updated_at": datetime.datetime.utcnow().isoformat(),
         "invocation_count": 0,
         "error_count": 0,
-        "endpoint": f"http://localhost:8000/functions/{name}/invoke"
+        "endpoint": f"http://localhost:8000/functions/{name}/invoke",
+        # Precomputed for the invoke response; hidden from API output
+        "_mem_used_str": f"{memory // 4}MB"
     }
     
     functions_store[name] = function_data
@@ -190,7 +211,7 @@ async def get_function(name: str):
     logs = function_logs.get(name, [])[-10:]  # Last 10 logs
     
     return {
-        "function": function_data,
+        "function": {k: v for k, v in function_data.items() if not k.startswith("_")},
         "logs": logs,
         "metrics": {
             "invocations": function_data["invocation_count"],
@@ -225,7 +246,7 @@ async def invoke_function(name: str, request: InvokeRequest):
             "function": name,
             "status": "success",
             "execution_time": "45ms",
-            "memory_used": f"{function_data['memory'] // 4}MB",
+            "memory_used": function_data["_mem_used_str"],
             "test_mode": request.test_mode
         }
     except Exception as e:
@@ -342,15 +363,31 @@ async def list_runtimes():
 
 # Helper functions
 def add_log(function_name: str, level: str, message: str):
-    """Add a log entry for a function"""
-    if function_name not in function_logs:
-        function_logs[function_name] = []
-    
-    function_logs[function_name].append({
+    """Queue a log entry for a function"""
+    _log_q.put_nowait((function_name, {
         "timestamp": datetime.datetime.utcnow().isoformat(),
         "level": level,
         "message": message
-    })
+    }))
+
+async def consume_logs():
+    """Drain queued log entries into function_logs in batches"""
+    while True:
+        batch = [await _log_q.get()]
+        while len(batch) < LOG_BATCH_SIZE and not _log_q.empty():
+            batch.append(_log_q.get_nowait())
+        store_logs(batch)
+
+def store_logs(batch: list):
+    """Append (function_name, entry) pairs to function_logs, grouped per function"""
+    grouped: Dict[str, list] = {}
+    for function_name, entry in batch:
+        grouped.setdefault(function_name, []).append(entry)
+    
+    for function_name, entries in grouped.items():
+        # Entries for functions deleted while queued are dropped
+        if function_name in function_logs:
+            function_logs[function_name].extend(entries)
 
 def calculate_success_rate(function_data: dict) -> float:
     """Calculate success rate for a function"""
@@ -1,12 +1,25 @@
 import os
+import io
 import sys
 import json
+import types
+import zipfile
+import tempfile
 import importlib.util
 from flask import Flask, request, jsonify
 from google.cloud import storage
 
 app = Flask(__name__)
 
+_gcs_client = None
+
+def _gcs():
+    """Return the shared Cloud Storage client, creating it on first use"""
+    global _gcs_client
+    if _gcs_client is None:
+        _gcs_client = storage.Client()
+    return _gcs_client
+
 def load_user_function():
     """Download and load user function from Cloud Storage"""
     bucket_name = os.environ.get('FUNCTION_BUCKET')
@@ -16,25 +29,37 @@ def load_user_function():
         raise ValueError("Missing function configuration")
     
     # Download function code
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
+    bucket = _gcs().bucket(bucket_name)
     blob = bucket.blob(function_path)
     
-    # Extract and load function
-    with tempfile.TemporaryDirectory() as temp_dir:
-        zip_path = os.path.join(temp_dir, 'function.zip')
-        blob.download_to_filename(zip_path)
-        
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-        
-        # Load main.py
-        spec = importlib.util.spec_from_file_location("user_function", 
-                                                     os.path.join(temp_dir, "main.py"))
-        user_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(user_module)
-        
+    data = blob.download_as_bytes()
+    zf = zipfile.ZipFile(io.BytesIO(data))
+    
+    # Self-contained handlers are executed straight from the archive
+    src = zf.read("main.py")
+    if not _needs_extraction(zf.namelist()) and b"__file__" not in src:
+        user_module = types.ModuleType("user_function")
+        user_module.__file__ = "<package>/main.py"
+        exec(compile(src, user_module.__file__, "exec"), user_module.__dict__)
         return user_module.handler
+    
+    # Packages with extra modules or native extensions, or that find bundled files
+    # relative to __file__, need a real directory
+    temp_dir = tempfile.mkdtemp()
+    zf.extractall(temp_dir)
+    sys.path.insert(0, temp_dir)
+    
+    # Load main.py
+    spec = importlib.util.spec_from_file_location("user_function", 
+                                                 os.path.join(temp_dir, "main.py"))
+    user_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(user_module)
+    
+    return user_module.handler
+
+def _needs_extraction(names):
+    """Check whether the package imports anything besides main.py"""
+    return any(name != "main.py" and name.endswith(('.py', '.pyc', '.so', '.pyd')) for name in names)
 
 # Load function at startup
 user_handler = load_user_function()
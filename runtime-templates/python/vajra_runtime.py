@@ -1,8 +1,9 @@
 import os
 import sys
-import json
 import importlib.util
+import importlib.machinery
 import traceback
+import orjson
 from flask import Flask, request, jsonify
 from google.cloud import logging as cloud_logging
 
@@ -17,9 +18,16 @@ def load_user_function():
     handler = os.environ.get('FUNCTION_TARGET', 'main')
     
     try:
-        # Import main module
-        if os.path.exists('main.py'):
+        # Import main module, preferring the bytecode compiled at build time
+        if os.path.exists('main.pyc'):
+            loader = importlib.machinery.SourcelessFileLoader("main", "main.pyc")
+            spec = importlib.util.spec_from_file_location("main", "main.pyc", loader=loader)
+        elif os.path.exists('main.py'):
             spec = importlib.util.spec_from_file_location("main", "main.py")
+        else:
+            spec = None
+        
+        if spec:
             main_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(main_module)
             
@@ -57,15 +65,18 @@ def execute_function():
     try:
         # Get request data
         if request.method == 'POST':
-            data = request.get_json() or {}
+            body = request.get_data(cache=False)
+            payload_size = len(body)
+            data = (orjson.loads(body) or {}) if body else {}
         else:
+            payload_size = len(request.query_string)
             data = dict(request.args)
         
         # Log invocation
         logger.log_struct({
             "message": "Function invoked",
             "method": request.method,
-            "payload_size": len(json.dumps(data))
+            "payload_size": payload_size
         })
         
         # Execute user function
@@ -1,106 +1,494 @@
 #!/usr/bin/env python3
 
-import requests
-import zipfile
 import os
+import atexit
 import sys
 import json
 import time
 import argparse
-import webbrowser
+import functools
+import hashlib
 import threading
-import http.server
-import socketserver
-import secrets
-import subprocess
-from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
 
+VERSION = "3.0"
 API_BASE = "https://vajra-api-gateway-635998496384.us-central1.run.app"
 CONFIG_DIR = Path.home() / ".vajra"
 CONFIG_FILE = CONFIG_DIR / "config.json"
-TOKEN_FILE = CONFIG_DIR / "token"
+LEGACY_TOKEN_FILE = CONFIG_DIR / "token"
+AUTH_CACHE_FILE = CONFIG_DIR / "auth_cache.json"
+CACHE_TTL = 30
+DETAILS_CACHE_TTL = 60
+# A verified token is trusted this long; any 401/403 drops it sooner
+AUTH_CACHE_TTL = 600
+
+# Throttled or temporarily unavailable responses worth retrying
+RETRY_STATUSES = (429, 502, 503, 504)
+# Longest pause between retries, whatever Retry-After asks for
+RETRY_WAIT_MAX = 60
+
+# Names per POST /functions:batchGet request
+BATCH_GET_SIZE = 50
+
+# Already-compressed formats are stored as-is in deployment packages
+STORED_EXTENSIONS = {
+    '.zip', '.whl', '.jar', '.gz', '.tgz', '.xz', '.bz2', '.zst',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2'
+}
+
+# Build artifacts and VCS metadata never shipped with a function
+IGNORE_DIRS = {'__pycache__', '.git', '.venv', 'venv', '.mypy_cache', '.pytest_cache'}
+IGNORE_FILES = {'.DS_Store'}
+
+# Threads reading files ahead of the zip writer while packaging
+PACKAGE_READ_WORKERS = 8
+
+# Python dependencies installed once per requirements.txt and reused by later deploys
+DEPS_CACHE_DIR = CONFIG_DIR / "deps"
+PIP_CACHE_DIR = CONFIG_DIR / "pip-cache"
+
+def _supports_unicode(stream):
+    """Check whether box-drawing characters can be written to a stream"""
+    try:
+        "┌─█".encode(stream.encoding or 'ascii')
+        return True
+    except (LookupError, UnicodeEncodeError):
+        return False
+
+_UNICODE_OUTPUT = _supports_unicode(sys.stdout)
+
+if _UNICODE_OUTPUT:
+    _BOX_H, _BOX_TL, _BOX_TR, _BOX_BL, _BOX_BR = "─", "┌", "┐", "└", "┘"
+    _BANNER = """
+┌─────────────────────────────────────────────────────────────────┐
+│                                                                 │
+│  ██╗   ██╗ █████╗      ██╗██████╗  █████╗     ██████╗██╗     ██╗│
+│  ██║   ██║██╔══██╗     ██║██╔══██╗██╔══██╗   ██╔════╝██║     ██║│
+│  ██║   ██║███████║     ██║██████╔╝███████║   ██║     ██║     ██║│
+│  ╚██╗ ██╔╝██╔══██║██   ██║██╔══██╗██╔══██║   ██║     ██║     ██║│
+│   ╚████╔╝ ██║  ██║╚█████╔╝██║  ██║██║  ██║   ╚██████╗███████╗██║│
+│    ╚═══╝  ╚═╝  ╚═╝ ╚════╝ ╚═╝  ╚═╝╚═╝  ╚═╝    ╚═════╝╚══════╝╚═╝│
+│                                                                 │
+│                 Vajra Serverless Platform CLI                   │
+│                     Enterprise Edition v3.0                     │
+│                                                                 │
+└─────────────────────────────────────────────────────────────────┘
+
+"""
+else:
+    _BOX_H, _BOX_TL, _BOX_TR, _BOX_BL, _BOX_BR = "-", "+", "+", "+", "+"
+    _BANNER = """
++-----------------------------------------------------------------+
+|                 Vajra Serverless Platform CLI                   |
+|                     Enterprise Edition v3.0                     |
++-----------------------------------------------------------------+
+
+"""
+
+# Section frame pieces shared by every command
+_SECTION_RULE = _BOX_H * 60
+_SECTION_END = f"{_BOX_BL}{_BOX_H * 62}{_BOX_BR}\n"
+_STATUS_SYMBOLS = {
+    'success': '[OK]',
+    'error': '[ERROR]',
+    'warning': '[WARN]',
+    'info': '[INFO]',
+    'progress': '[PROGRESS]'
+}
+
+# Per-function block in `list`, rendered with %-formatting and written in one call
+_FUNCTION_FMT = (
+    "  * %(name)s\n"
+    "     Runtime       : %(runtime)s\n"
+    "     Status        : %(status)s\n"
+    "     Version       : %(version)s\n"
+    "     Invocations   : %(invocation_count)s\n"
+    "     Created       : %(created_at)s\n"
+)
+_DESCRIPTION_FMT = "     Description   : %s\n"
+
+# Results are pretty-printed for terminals and kept compact when piped
+try:
+    import orjson
+    
+    def _dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    
+    _dumpb = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, pretty=False):
+        return json.dumps(obj, indent=2) if pretty else json.dumps(obj, separators=(',', ':'))
+    
+    def _dumpb(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    _loads = json.loads
+
+_PRETTY = sys.stdout.isatty()
+
+def _format_json(obj):
+    return _dumps(obj, pretty=_PRETTY)
+
+def _max_age(cache_control):
+    """Seconds a response may be reused per its Cache-Control header, or None if unspecified"""
+    if not cache_control:
+        return None
+    for directive in cache_control.lower().split(','):
+        directive = directive.strip()
+        if directive in ('no-cache', 'no-store'):
+            return 0
+        if directive.startswith('max-age='):
+            try:
+                return int(directive[8:])
+            except ValueError:
+                return None
+    return None
+
+def _last_line(output):
+    """Last non-empty line of a subprocess's captured output, which is where pip and npm put the error"""
+    lines = output.decode(errors='replace').strip().splitlines() if output else []
+    return lines[-1] if lines else "unknown error"
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, copying when linking is not possible (other filesystem, dst exists)"""
+    import shutil
+    
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+@functools.lru_cache(maxsize=32)
+def _detect_runtime(path, mtime_ns):
+    """Detect the runtime of a source directory, cached per directory mtime"""
+    # One directory listing instead of a stat/listdir per marker
+    with os.scandir(path) as it:
+        names = {entry.name for entry in it}
+    suffixes = {os.path.splitext(name)[1] for name in names}
+    
+    if "requirements.txt" in names or '.py' in suffixes:
+        return "python3.11"
+    elif "package.json" in names:
+        return "nodejs18"
+    elif '.go' in suffixes:
+        return "go1.21"
+    elif '.java' in suffixes:
+        return "java17"
+    else:
+        return "python3.11"
+
+# Local ports tried for the OAuth redirect; 0 lets the OS pick a free one
+OAUTH_CALLBACK_PORTS = (8080, 8765, 0)
+
+@functools.cache
+def _callback_server_class():
+    """OAuth callback server class, built once on first use so other commands never import http.server"""
+    import http.server
+    import socketserver
+    from urllib.parse import urlparse, parse_qs
+    
+    class CallbackHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            oauth = self.server.oauth
+            if self.path.startswith('/callback'):
+                parsed = urlparse(self.path)
+                params = parse_qs(parsed.query)
+                
+                if 'code' in params and params.get('state', [None])[0] == oauth['state']:
+                    code = params['code'][0]
+                    
+                    try:
+                        callback_response = oauth['session'].get(
+                            f"{oauth['api_base']}/auth/oauth/callback",
+                            params={
+                                'code': code,
+                                'state': oauth['state'],
+                                'code_verifier': oauth['code_verifier'],
+                                'redirect_uri': oauth['redirect_uri']
+                            },
+                            timeout=30
+                        )
+                        
+                        if callback_response.status_code == 200:
+                            auth_data = _loads(callback_response.content)
+                            oauth["result"]["token"] = auth_data["token"]
+                            oauth["result"]["user"] = auth_data["user"]
+                            
+                            self.send_response(200)
+                            self.send_header('Content-type', 'text/html')
+                            self.end_headers()
+                            self.wfile.write(b'''
+                            <!DOCTYPE html>
+                            <html><head><title>Vajra CLI</title></head>
+                            <body style="margin:0;padding:0;background:#000;color:#fff;font-family:ui-monospace,SFMono-Regular,Consolas,monospace;height:100vh;display:flex;align-items:center;justify-content:center">
+                            <div style="max-width:480px;padding:48px;text-align:center">
+                            <h1 style="margin:0 0 24px 0;font-size:24px;font-weight:600;letter-spacing:-0.025em">Authentication Successful</h1>
+                            <p style="margin:0 0 16px 0;font-size:16px;color:#888;line-height:1.5">You have been successfully authenticated with Vajra CLI.</p>
+                            <p style="margin:0;font-size:14px;color:#666">You can close this window and return to the terminal.</p>
+                            </div>
+                            <script>setTimeout(() => window.close(), 2000);</script>
+                            </body></html>
+                            ''')
+                        else:
+                            oauth["result"]["error"] = f"Authentication failed: {callback_response.text}"
+                            self.send_response(400)
+                            self.send_header('Content-type', 'text/html')
+                            self.end_headers()
+                            self.wfile.write(b'''
+                            <!DOCTYPE html>
+                            <html><head><title>Vajra CLI</title></head>
+                            <body style="margin:0;padding:0;background:#000;color:#fff;font-family:ui-monospace,SFMono-Regular,Consolas,monospace;height:100vh;display:flex;align-items:center;justify-content:center">
+                            <div style="max-width:480px;padding:48px;text-align:center">
+                            <h1 style="margin:0 0 24px 0;font-size:24px;font-weight:600;letter-spacing:-0.025em">Authentication Failed</h1>
+                            <p style="margin:0 0 16px 0;font-size:16px;color:#888;line-height:1.5">There was an error during authentication.</p>
+                            <p style="margin:0;font-size:14px;color:#666">Please try again or contact support.</p>
+                            </div>
+                            </body></html>
+                            ''')
+                    except Exception as e:
+                        oauth["result"]["error"] = f"Error: {str(e)}"
+                        self.send_response(500)
+                        self.send_header('Content-type', 'text/html')
+                        self.end_headers()
+                        self.wfile.write(b'<html><body><h2>Error</h2></body></html>')
+                else:
+                    oauth["result"]["error"] = "Invalid parameters"
+                    self.send_response(400)
+                    self.send_header('Content-type', 'text/html')
+                    self.end_headers()
+                    self.wfile.write(b'<html><body><h2>Invalid Request</h2></body></html>')
+            else:
+                self.send_response(404)
+                self.end_headers()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    class CallbackServer(socketserver.TCPServer):
+        allow_reuse_address = True
+        
+        def __init__(self, port, oauth):
+            super().__init__(("", port), CallbackHandler)
+            self.oauth = oauth
+    
+    return CallbackServer
 
 class VajraCLI:
+    # One instance per run; fixed attributes keep it dict-free
+    __slots__ = ('api_base', 'config', 'token', 'use_cache', 'refresh', 'max_retries', '_auth_ok', '_session')
+    
     def __init__(self):
         self.api_base = API_BASE
         self.config = self.load_config()
-        self.token = self.load_token()
+        self.token = self.config.get('token')
+        self.use_cache = True
+        self.refresh = False
+        self.max_retries = 3
+        self._auth_ok = False
+        self._session = None
+    
+    @property
+    def session(self):
+        """Pooled HTTP session, created on first use so offline commands skip importing requests"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # One pooled session for every API call so connections are reused
+            session = requests.Session()
+            # Ride out Cloud Run cold starts and throttling with backoff, honouring
+            # Retry-After; once retries are spent the last response is returned as-is.
+            # POST is left out: repeating an invoke would run the function twice
+            retry = Retry(
+                total=self.max_retries,
+                connect=self.max_retries,
+                read=self.max_retries,
+                status=self.max_retries,
+                backoff_factor=0.3,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods={'GET', 'HEAD', 'DELETE'},
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': f'vajra-cli/{VERSION}',
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, deflate'
+            })
+            session.hooks['response'].append(self._on_response)
+            if self.token:
+                session.headers['Authorization'] = f"Bearer {self.token}"
+            atexit.register(session.close)
+            self._session = session
+        return self._session
+    
+    def prewarm(self):
+        """Open the API connection in the background while the command gets ready.
+        The warm connection goes back to the session pool for the first real request.
+        """
+        session = self.session
+        
+        def warm():
+            try:
+                session.head(f"{self.api_base}/health", timeout=2)
+            except Exception:
+                pass
+        
+        threading.Thread(target=warm, daemon=True).start()
     
     def load_config(self):
+        """Read config.json once; the token lives in the same file as the profile"""
+        state = {}
         if CONFIG_FILE.exists():
             with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        return {}
+                state = json.load(f)
+        if 'token' not in state and LEGACY_TOKEN_FILE.exists():
+            state['token'] = LEGACY_TOKEN_FILE.read_text().strip()
+        return state
+    
+    def _flush(self):
+        """Write config.json via a temp file and os.replace so it is never left half-written"""
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.config, f, indent=2)
+            # Make sure the new contents are on disk before they replace the old file
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_file, 0o600)
+        os.replace(tmp_file, CONFIG_FILE)
+        if LEGACY_TOKEN_FILE.exists():
+            LEGACY_TOKEN_FILE.unlink()
     
     def save_config(self, config):
-        CONFIG_DIR.mkdir(exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
-        self.config = config
-    
-    def load_token(self):
-        if TOKEN_FILE.exists():
-            with open(TOKEN_FILE, 'r') as f:
-                return f.read().strip()
-        return None
+        self.config = {**config, 'token': self.token} if self.token else dict(config)
+        self._flush()
     
     def save_token(self, token):
-        CONFIG_DIR.mkdir(exist_ok=True)
-        with open(TOKEN_FILE, 'w') as f:
-            f.write(token)
-        os.chmod(TOKEN_FILE, 0o600)
+        self.config['token'] = token
         self.token = token
+        self._flush()
+        if self._session is not None:
+            self._session.headers['Authorization'] = f"Bearer {token}"
+        self.clear_cache()
     
-    def get_auth_headers(self):
-        if not self.token:
-            raise Exception("Not authenticated. Run 'vajra init' first.")
-        return {"Authorization": f"Bearer {self.token}"}
+    def _load_cache_entry(self, cache_file):
+        if not self.use_cache:
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            return None
     
-    def print_banner(self):
-        banner = """
-┌─────────────────────────────────────────────────────────────────┐
-│                                                                 │
-│  ██╗   ██╗ █████╗      ██╗██████╗  █████╗     ██████╗██╗     ██╗│
-│  ██║   ██║██╔══██╗     ██║██╔══██╗██╔══██╗   ██╔════╝██║     ██║│
-│  ██║   ██║███████║     ██║██████╔╝███████║   ██║     ██║     ██║│
-│  ╚██╗ ██╔╝██╔══██║██   ██║██╔══██╗██╔══██║   ██║     ██║     ██║│
-│   ╚████╔╝ ██║  ██║╚█████╔╝██║  ██║██║  ██║   ╚██████╗███████╗██║│
-│    ╚═══╝  ╚═╝  ╚═╝ ╚════╝ ╚═╝  ╚═╝╚═╝  ╚═╝    ╚═════╝╚══════╝╚═╝│
-│                                                                 │
-│                 Vajra Serverless Platform CLI                   │
-│                     Enterprise Edition v3.0                     │
-│                                                                 │
-└─────────────────────────────────────────────────────────────────┘
+    def _is_fresh(self, entry, ttl):
+        """An entry is fresh within the server's max-age if it sent one, else within ttl"""
+        max_age = entry.get('max_age')
+        return time.time() - entry.get('timestamp', 0) < (ttl if max_age is None else max_age)
+    
+    def read_cache(self, cache_file, ttl=CACHE_TTL):
+        """Return cached data if it is still fresh"""
+        entry = self._load_cache_entry(cache_file)
+        if entry and self._is_fresh(entry, ttl):
+            return entry.get('data')
+        return None
+    
+    def write_cache(self, cache_file, data, etag=None, max_age=None):
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and swap it in, so a concurrent reader never sees half a file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'w') as f:
+            f.write(_dumps({'timestamp': time.time(), 'etag': etag, 'max_age': max_age, 'data': data}))
+        os.replace(tmp_file, cache_file)
+    
+    def clear_cache(self):
+        self._auth_ok = False
+        AUTH_CACHE_FILE.unlink(missing_ok=True)
+        for cache_file in CONFIG_DIR.glob("cache_*.json"):
+            cache_file.unlink(missing_ok=True)
+    
+    def _cache_file(self, url):
+        return CONFIG_DIR / f"cache_{hashlib.sha1(url.encode()).hexdigest()}.json"
+    
+    def cached_get(self, url, ttl=CACHE_TTL):
+        """GET a JSON endpoint through the local cache, revalidating stale
+        entries with If-None-Match. Returns (data, None) or (None, error_text).
         """
-        print(banner)
+        cache_file = self._cache_file(url)
+        entry = self._load_cache_entry(cache_file)
+        if entry and not self.refresh and self._is_fresh(entry, ttl):
+            return entry['data'], None
+        
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        response = self.session.get(url, headers=headers)
+        
+        max_age = _max_age(response.headers.get('Cache-Control'))
+        if response.status_code == 304 and entry:
+            data, etag = entry['data'], entry['etag']
+            if max_age is None:
+                max_age = entry.get('max_age')
+        elif response.status_code == 200:
+            data, etag = _loads(response.content), response.headers.get('ETag')
+        else:
+            return None, response.text
+        
+        if self.use_cache:
+            self.write_cache(cache_file, data, etag, max_age)
+        return data, None
+    
+    def _details_url(self, name):
+        # details only prints the function record, so skip the logs and metrics
+        return f"{self.api_base}/functions/{name}?fields=function"
+    
+    def invalidate_function_cache(self, name):
+        """Drop cached list and details responses after a change to a function"""
+        for url in (f"{self.api_base}/functions", self._details_url(name)):
+            self._cache_file(url).unlink(missing_ok=True)
+    
+    def _on_response(self, response, *args, **kwargs):
+        """Forget a cached auth check as soon as the API rejects the token"""
+        if response.status_code in (401, 403):
+            self._auth_ok = False
+            AUTH_CACHE_FILE.unlink(missing_ok=True)
+    
+    def print_banner(self):
+        sys.stdout.write(_BANNER)
     
     def print_section(self, title):
-        print(f"\n┌─ {title} " + "─" * (60 - len(title)) + "┐")
+        sys.stdout.write(f"\n{_BOX_TL}{_BOX_H} {title} {_SECTION_RULE[len(title):]}{_BOX_TR}\n")
     
     def print_end_section(self):
-        print("└" + "─" * 62 + "┘")
+        sys.stdout.write(_SECTION_END)
     
     def print_status(self, status, message):
-        symbols = {
-            'success': '[OK]',
-            'error': '[ERROR]',
-            'warning': '[WARN]',
-            'info': '[INFO]',
-            'progress': '[PROGRESS]'
-        }
-        symbol = symbols.get(status, '[INFO]')
-        print(f"  {symbol} {message}")
-    
-    def check_auth(self):
-        """Check if current token is valid"""
+        symbol = _STATUS_SYMBOLS.get(status, '[INFO]')
+        sys.stdout.write(f"  {symbol} {message}\n")
+    
+    def check_auth(self, verify=False):
+        """Check for a token. The API rejects a bad one with 401 on the real call,
+        so /auth/user is only probed when verify is set.
+        """
         if not self.token:
             return False
+        if not verify or self._auth_ok or self.read_cache(AUTH_CACHE_FILE, AUTH_CACHE_TTL):
+            self._auth_ok = True
+            return True
         try:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.get(f"{self.api_base}/auth/user", headers=headers)
-            return response.status_code == 200
+            response = self.session.get(f"{self.api_base}/auth/user")
+            if response.status_code == 200:
+                self.write_cache(AUTH_CACHE_FILE, True)
+                self._auth_ok = True
+                return True
+            return False
         except:
             return False
     
@@ -108,12 +496,13 @@ class VajraCLI:
         self.print_section("AUTHENTICATION")
         
         # Check if already authenticated
-        if self.token and self.check_auth():
-            print("  User already authenticated:")
-            print(f"  Email: {self.config.get('user_email', 'Unknown')}")
-            print(f"  User ID: {self.config.get('user_id', 'Unknown')}")
-            print(f"  Auth Method: {self.config.get('auth_method', 'Unknown')}")
-            print()
+        if self.token and self.check_auth(verify=True):
+            sys.stdout.write(
+                "  User already authenticated:\n"
+                f"  Email: {self.config.get('user_email', 'Unknown')}\n"
+                f"  User ID: {self.config.get('user_id', 'Unknown')}\n"
+                f"  Auth Method: {self.config.get('auth_method', 'Unknown')}\n\n"
+            )
             
             choice = input("  Continue with current account? (y/n): ").strip().lower()
             if choice == 'y':
@@ -148,12 +537,18 @@ class VajraCLI:
             return False
         
         try:
-            if TOKEN_FILE.exists():
-                TOKEN_FILE.unlink()
-            if CONFIG_FILE.exists():
-                CONFIG_FILE.unlink()
+            if LEGACY_TOKEN_FILE.exists():
+                LEGACY_TOKEN_FILE.unlink()
             self.token = None
-            self.config = {}
+            # The OAuth client ID is not a credential; keep it so the next init skips a round trip
+            self.config = {k: v for k, v in self.config.items() if k == 'oauth_client_id'}
+            if self.config:
+                self._flush()
+            elif CONFIG_FILE.exists():
+                CONFIG_FILE.unlink()
+            if self._session is not None:
+                self._session.headers.pop('Authorization', None)
+            self.clear_cache()
             
             self.print_status('success', "Successfully logged out")
             self.print_end_section()
@@ -165,6 +560,8 @@ class VajraCLI:
     
     def dev_auth(self):
         """Simple development authentication"""
+        from datetime import datetime
+        
         print("\n  Development Authentication:")
         email = input("  Enter your email: ").strip()
         
@@ -177,10 +574,10 @@ class VajraCLI:
         
         try:
             headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get(f"{self.api_base}/auth/user", headers=headers)
+            response = self.session.get(f"{self.api_base}/auth/user", headers=headers)
             
             if response.status_code == 200:
-                user_info = response.json()
+                user_info = _loads(response.content)
                 self.save_token(token)
                 
                 config = {
@@ -206,100 +603,72 @@ class VajraCLI:
     
     def oauth_auth(self):
         """OAuth browser-based authentication"""
+        import webbrowser
+        import base64
+        import secrets
+        from urllib.parse import urlparse, parse_qs, urlencode
+        from datetime import datetime
+        
         print("\n  Secure OAuth Authentication:", flush=True)
         print("  This will open your browser for Google authentication.", flush=True)
         print(flush=True)
         try:
-            # Get OAuth URL from server
-            print("  Contacting auth server...", end="\r", flush=True)
-            response = requests.get(f"{self.api_base}/auth/oauth/url", timeout=10)
-            if response.status_code != 200:
-                self.print_status('error', f"Failed to get OAuth URL: {response.text}")
-                self.print_end_section()
-                return False
+            # The OAuth client ID is fetched once and remembered; the auth URL,
+            # state and PKCE verifier are then built locally with no round trip
+            client_id = self.config.get('oauth_client_id')
+            if not client_id:
+                print("  Contacting auth server...", end="\r", flush=True)
+                response = self.session.get(f"{self.api_base}/auth/oauth/url", timeout=10)
+                if response.status_code != 200:
+                    self.print_status('error', f"Failed to get OAuth URL: {response.text}")
+                    self.print_end_section()
+                    return False
+                
+                oauth_data = _loads(response.content)
+                client_id = oauth_data.get("client_id") or \
+                    parse_qs(urlparse(oauth_data["oauth_url"]).query)["client_id"][0]
             
-            oauth_data = response.json()
-            oauth_url = oauth_data["oauth_url"]
-            state = oauth_data["state"]
+            state = secrets.token_urlsafe(32)
+            code_verifier = secrets.token_urlsafe(64)
+            code_challenge = base64.urlsafe_b64encode(
+                hashlib.sha256(code_verifier.encode()).digest()
+            ).rstrip(b'=').decode()
             
-            # Start local callback server on port 8080
+            # Listen for the redirect on the first free port; loopback redirects may use any port
             callback_result = {"token": None, "user": None, "error": None}
-            api_base = self.api_base
+            oauth = {
+                "session": self.session,
+                "api_base": self.api_base,
+                "state": state,
+                "code_verifier": code_verifier,
+                "result": callback_result
+            }
+            httpd = None
+            for port in OAUTH_CALLBACK_PORTS:
+                try:
+                    httpd = _callback_server_class()(port, oauth)
+                    break
+                except OSError:
+                    continue
+            if httpd is None:
+                self.print_status('error', "Could not start the local callback server")
+                self.print_end_section()
+                return False
             
-            class CallbackHandler(http.server.BaseHTTPRequestHandler):
-                def do_GET(self):
-                    if self.path.startswith('/callback'):
-                        parsed = urlparse(self.path)
-                        params = parse_qs(parsed.query)
-                        
-                        if 'code' in params and 'state' in params:
-                            code = params['code'][0]
-                            callback_state = params['state'][0]
-                            
-                            try:
-                                callback_response = requests.get(
-                                    f"{api_base}/auth/oauth/callback?code={code}&state={callback_state}",
-                                    timeout=30
-                                )
-                                
-                                if callback_response.status_code == 200:
-                                    auth_data = callback_response.json()
-                                    callback_result["token"] = auth_data["token"]
-                                    callback_result["user"] = auth_data["user"]
-                                    
-                                    self.send_response(200)
-                                    self.send_header('Content-type', 'text/html')
-                                    self.end_headers()
-                                    self.wfile.write(b'''
-                                    <!DOCTYPE html>
-                                    <html><head><title>Vajra CLI</title></head>
-                                    <body style="margin:0;padding:0;background:#000;color:#fff;font-family:ui-monospace,SFMono-Regular,Consolas,monospace;height:100vh;display:flex;align-items:center;justify-content:center">
-                                    <div style="max-width:480px;padding:48px;text-align:center">
-                                    <h1 style="margin:0 0 24px 0;font-size:24px;font-weight:600;letter-spacing:-0.025em">Authentication Successful</h1>
-                                    <p style="margin:0 0 16px 0;font-size:16px;color:#888;line-height:1.5">You have been successfully authenticated with Vajra CLI.</p>
-                                    <p style="margin:0;font-size:14px;color:#666">You can close this window and return to the terminal.</p>
-                                    </div>
-                                    <script>setTimeout(() => window.close(), 2000);</script>
-                                    </body></html>
-                                    ''')
-                                else:
-                                    callback_result["error"] = f"Authentication failed: {callback_response.text}"
-                                    self.send_response(400)
-                                    self.send_header('Content-type', 'text/html')
-                                    self.end_headers()
-                                    self.wfile.write(b'''
-                                    <!DOCTYPE html>
-                                    <html><head><title>Vajra CLI</title></head>
-                                    <body style="margin:0;padding:0;background:#000;color:#fff;font-family:ui-monospace,SFMono-Regular,Consolas,monospace;height:100vh;display:flex;align-items:center;justify-content:center">
-                                    <div style="max-width:480px;padding:48px;text-align:center">
-                                    <h1 style="margin:0 0 24px 0;font-size:24px;font-weight:600;letter-spacing:-0.025em">Authentication Failed</h1>
-                                    <p style="margin:0 0 16px 0;font-size:16px;color:#888;line-height:1.5">There was an error during authentication.</p>
-                                    <p style="margin:0;font-size:14px;color:#666">Please try again or contact support.</p>
-                                    </div>
-                                    </body></html>
-                                    ''')
-                            except Exception as e:
-                                callback_result["error"] = f"Error: {str(e)}"
-                                self.send_response(500)
-                                self.send_header('Content-type', 'text/html')
-                                self.end_headers()
-                                self.wfile.write(b'<html><body><h2>Error</h2></body></html>')
-                        else:
-                            callback_result["error"] = "Invalid parameters"
-                            self.send_response(400)
-                            self.send_header('Content-type', 'text/html')
-                            self.end_headers()
-                            self.wfile.write(b'<html><body><h2>Invalid Request</h2></body></html>')
-                    else:
-                        self.send_response(404)
-                        self.end_headers()
-                
-                def log_message(self, format, *args):
-                    pass
+            port = httpd.server_address[1]
+            oauth["redirect_uri"] = f"http://localhost:{port}/callback"
+            oauth_url = "https://accounts.google.com/o/oauth2/auth?" + urlencode({
+                'client_id': client_id,
+                'redirect_uri': oauth["redirect_uri"],
+                'scope': 'openid email profile',
+                'response_type': 'code',
+                'state': state,
+                'code_challenge': code_challenge,
+                'code_challenge_method': 'S256'
+            })
             
-            # Start server on port 8080
-            with socketserver.TCPServer(("", 8080), CallbackHandler) as httpd:
-                print(f"  Starting callback server on port 8080...")
+            with httpd:
+                print(f"  Starting callback server on port {port}...")
                 print(f"  Opening browser for authentication...")
                 print(f"  If browser doesn't open, visit: {oauth_url}")
                 print()
@@ -307,15 +676,15 @@ class VajraCLI:
                 # Open browser
                 webbrowser.open(oauth_url)
                 
-                # Wait for callback
-                timeout = 300
-                start_time = time.time()
-                
-                while time.time() - start_time < timeout:
-                    httpd.handle_request()
-                    if callback_result["token"] or callback_result["error"]:
+                # Block on the callback; stray requests such as /favicon.ico just
+                # loop back here, and the server timeout bounds the whole wait
+                deadline = time.time() + 300
+                while not (callback_result["token"] or callback_result["error"]):
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
                         break
-                    time.sleep(0.1)
+                    httpd.timeout = remaining
+                    httpd.handle_request()
                 
                 if callback_result["error"]:
                     self.print_status('error', callback_result["error"])
@@ -329,7 +698,8 @@ class VajraCLI:
                         "user_email": user_info["email"],
                         "user_id": user_info["user_id"],
                         "authenticated_at": datetime.now().isoformat(),
-                        "auth_method": "oauth"
+                        "auth_method": "oauth",
+                        "oauth_client_id": client_id
                     }
                     self.save_config(config)
                     
@@ -353,19 +723,20 @@ class VajraCLI:
         self.print_section("USER INFORMATION")
         
         try:
-            headers = self.get_auth_headers()
-            response = requests.get(f"{self.api_base}/auth/user", headers=headers)
+            response = self.session.get(f"{self.api_base}/auth/user")
             
             if response.status_code == 200:
-                user_info = response.json()
+                user_info = _loads(response.content)
                 user = user_info['user']
                 
-                print(f"  Email: {user['email']}")
-                print(f"  User ID: {user['user_id']}")
-                print(f"  Status: Authenticated")
-                
+                lines = [
+                    f"  Email: {user['email']}",
+                    f"  User ID: {user['user_id']}",
+                    "  Status: Authenticated",
+                ]
                 if 'authenticated_at' in self.config:
-                    print(f"  Authenticated: {self.config['authenticated_at']}")
+                    lines.append(f"  Authenticated: {self.config['authenticated_at']}")
+                sys.stdout.write("\n".join(lines) + "\n")
                 
             else:
                 self.print_status('error', "Failed to get user information")
@@ -377,18 +748,27 @@ class VajraCLI:
     
     def deploy_function(self, name, path, runtime="python3.11", handler="main", 
                        memory=512, timeout=30, description="", env_vars=None):
+        from concurrent.futures import ThreadPoolExecutor
+        
         if not self.check_auth():
             return None
+        
+        # Verify the token while packaging runs; it only has to be settled before the upload
+        auth_pool = ThreadPoolExecutor(max_workers=1)
+        auth_check = auth_pool.submit(self.check_auth, True)
+        auth_pool.shutdown(wait=False)
             
         self.print_section("FUNCTION DEPLOYMENT")
         
-        print(f"  Function Name    : {name}")
-        print(f"  Runtime          : {runtime}")
-        print(f"  Handler          : {handler}")
-        print(f"  Memory           : {memory}MB")
-        print(f"  Timeout          : {timeout}s")
-        print(f"  Source Path      : {path}")
-        print(f"  User             : {self.config.get('user_email', 'Unknown')}")
+        sys.stdout.write(
+            f"  Function Name    : {name}\n"
+            f"  Runtime          : {runtime}\n"
+            f"  Handler          : {handler}\n"
+            f"  Memory           : {memory}MB\n"
+            f"  Timeout          : {timeout}s\n"
+            f"  Source Path      : {path}\n"
+            f"  User             : {self.config.get('user_email', 'Unknown')}\n"
+        )
         
         if runtime == "auto":
             runtime = self.detect_runtime(path)
@@ -408,7 +788,8 @@ class VajraCLI:
             if os.path.isfile(path):
                 shutil.copy2(path, package_dir)
             else:
-                shutil.copytree(path, package_dir, dirs_exist_ok=True)
+                shutil.copytree(path, package_dir, dirs_exist_ok=True,
+                                ignore=shutil.ignore_patterns(*IGNORE_DIRS, *IGNORE_FILES))
             
             # Install dependencies based on runtime
             if runtime.startswith("python"):
@@ -418,45 +799,79 @@ class VajraCLI:
             
             self.print_status('progress', "Creating deployment package...")
             
-            # Create zip with all dependencies
-            zip_path = f"{name}.zip"
-            file_count = 0
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for root, dirs, files in os.walk(package_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arc_path = os.path.relpath(file_path, package_dir)
-                        zf.write(file_path, arc_path)
-                        file_count += 1
+            zip_buffer, file_count = self._build_package(package_dir)
         
         self.print_status('info', f"Packaged {file_count} files with dependencies")
-        self.print_status('progress', "Uploading to Vajra platform...")
+        
+        if not auth_check.result():
+            zip_buffer.close()
+            self.print_status('error', "Authentication failed, run 'init' to sign in again")
+            self.print_end_section()
+            return None
         
         try:
-            with open(zip_path, 'rb') as f:
-                files = {'code': (zip_path, f, 'application/zip')}
-                data = {
-                    'name': name,
-                    'runtime': runtime,
-                    'handler': handler,
-                    'memory': memory,
-                    'timeout': timeout,
-                    'description': description,
-                    'environment': json.dumps(env_vars or {})
-                }
-                
-                headers = self.get_auth_headers()
-                response = requests.post(f"{self.api_base}/functions", 
-                                       files=files, data=data, headers=headers)
+            zip_buffer.seek(0)
+            sha256 = hashlib.sha256()
+            md5 = hashlib.md5()
+            for chunk in iter(lambda: zip_buffer.read(1024 * 1024), b''):
+                sha256.update(chunk)
+                md5.update(chunk)
+            digest = sha256.hexdigest()
+            
+            data = {
+                'name': name,
+                'runtime': runtime,
+                'handler': handler,
+                'memory': str(memory),
+                'timeout': str(timeout),
+                'description': description,
+                'environment': _dumps(env_vars or {}),
+                'artifact_sha256': digest
+            }
+            # Same key on every retry of this upload, so the gateway deploys it once
+            headers = {'Idempotency-Key': os.urandom(16).hex()}
             
-            os.remove(zip_path)
+            # Packages are deterministic, so an unchanged one is already stored under its hash
+            if self.session.head(f"{self.api_base}/artifacts/{digest}").status_code == 200:
+                self.print_status('info', "Package unchanged, skipping upload")
+                response = self._retry_post(lambda: self.session.post(f"{self.api_base}/functions",
+                                                                      data=data, headers=headers))
+            elif self._upload_artifact(digest, md5.digest(), zip_buffer):
+                # Stored under its hash now, so deploy it like an unchanged package
+                response = self._retry_post(lambda: self.session.post(f"{self.api_base}/functions",
+                                                                      data=data, headers=headers))
+            else:
+                self.print_status('progress', "Uploading to Vajra platform...")
+                code = (f"{name}.zip", zip_buffer, 'application/zip')
+                
+                try:
+                    from requests_toolbelt import MultipartEncoder
+                except ImportError:
+                    MultipartEncoder = None
+                
+                # A streamed body can't be rewound, so every attempt starts the package over
+                def send():
+                    zip_buffer.seek(0)
+                    if MultipartEncoder is None:
+                        # requests assembles the whole multipart body in memory first
+                        return self.session.post(f"{self.api_base}/functions",
+                                                 files={'code': code}, data=data, headers=headers)
+                    # Stream the form straight from the package buffer to the socket
+                    encoder = MultipartEncoder(fields={**data, 'code': code})
+                    return self.session.post(f"{self.api_base}/functions", data=encoder,
+                                             headers={**headers, 'Content-Type': encoder.content_type})
+                
+                response = self._retry_post(send)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
+                self.invalidate_function_cache(name)
                 self.print_status('success', f"Function deployed successfully!")
-                print(f"  Function ID: {result['function_id']}")
-                print(f"  Status: {result['status']}")
-                print(f"  Version: {result['version']}")
+                sys.stdout.write(
+                    f"  Function ID: {result['function_id']}\n"
+                    f"  Status: {result['status']}\n"
+                    f"  Version: {result['version']}\n"
+                )
                 self.print_end_section()
                 return result
             else:
@@ -465,27 +880,180 @@ class VajraCLI:
                 return None
                 
         except Exception as e:
-            if os.path.exists(zip_path):
-                os.remove(zip_path)
             self.print_status('error', f"Deployment error: {str(e)}")
             self.print_end_section()
             return None
+        finally:
+            zip_buffer.close()
+    
+    def _retry_post(self, send):
+        """Call send() again while it gets a throttled or unavailable response, backing off
+        like the session does for GETs. Only for POSTs carrying an Idempotency-Key.
+        """
+        import requests
+        
+        delay = 0.3
+        for attempt in range(self.max_retries):
+            try:
+                response = send()
+            except requests.exceptions.ConnectionError:
+                # The request may have reached the gateway, but the key makes resending safe
+                wait = delay
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                retry_after = response.headers.get('Retry-After', '')
+                wait = int(retry_after) if retry_after.isdigit() else delay
+            time.sleep(min(wait, RETRY_WAIT_MAX))
+            delay *= 2
+        return send()
+    
+    def _upload_artifact(self, digest, md5, package):
+        """PUT the package straight to storage through a signed URL.
+        Returns False when the gateway can't issue one, so the caller falls back to a multipart upload.
+        """
+        import base64
+        import requests
+        
+        content_md5 = base64.b64encode(md5).decode()
+        response = self.session.post(f"{self.api_base}/artifacts/{digest}/upload-url",
+                                     data=_dumps({'content_md5': content_md5}),
+                                     headers={'Content-Type': 'application/json'})
+        if response.status_code != 200:
+            return False
+        
+        self.print_status('progress', "Uploading to storage...")
+        package.seek(0)
+        # The URL carries its own signature, so send it outside the API session: storage rejects
+        # a bearer token alongside it, and its 401/403s say nothing about the API token
+        try:
+            upload = requests.put(_loads(response.content)['upload_url'], data=package,
+                                  headers={'Content-Type': 'application/zip',
+                                           'Content-MD5': content_md5})
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.print_status('warning', "Direct upload failed (storage unreachable), retrying through the API")
+            return False
+        if upload.status_code != 200:
+            self.print_status('warning', f"Direct upload failed ({upload.status_code}), retrying through the API")
+            return False
+        return True
+    
+    def _build_package(self, package_dir):
+        """Zip package_dir into a spooled buffer, returning (buffer, file_count)"""
+        import tempfile
+        import zipfile
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Archive names are sliced off the absolute path instead of calling relpath per file
+        base = os.path.abspath(package_dir)
+        prefix_len = len(base) + 1
+        entries = []
+        # One scandir per directory; DirEntry paths are already joined and
+        # type checks reuse the d_type from the listing instead of a stat
+        stack = [base]
+        while stack:
+            directory = stack.pop()
+            in_node_modules = os.path.basename(directory) == 'node_modules'
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        # Symlinked directories are skipped, as os.walk did
+                        if not (entry.is_symlink() or entry.name in IGNORE_DIRS or
+                                (in_node_modules and entry.name == '.cache')):
+                            stack.append(entry.path)
+                        continue
+                    if entry.name in IGNORE_FILES:
+                        continue
+                    arc_path = entry.path[prefix_len:]
+                    if os.sep != '/':
+                        arc_path = arc_path.replace(os.sep, '/')
+                    entries.append((arc_path, entry.path))
+        # Sorted names and a fixed timestamp make re-deploys of the same tree byte-identical
+        entries.sort()
+        
+        def read_entry(entry):
+            arc_path, file_path = entry
+            zinfo = zipfile.ZipInfo(arc_path, date_time=(1980, 1, 1, 0, 0, 0))
+            mode = 0o755 if os.access(file_path, os.X_OK) else 0o644
+            zinfo.external_attr = (0o100000 | mode) << 16
+            with open(file_path, 'rb') as f:
+                return zinfo, f.read()
+        
+        # Create zip with all dependencies; small packages never touch disk
+        zip_buffer = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024,
+                                                   buffering=512 * 1024)
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf, \
+             ThreadPoolExecutor(max_workers=PACKAGE_READ_WORKERS) as pool:
+            # Read ahead on worker threads while this thread compresses and writes,
+            # keeping a bounded number of files in memory
+            remaining = iter(entries)
+            pending = deque(pool.submit(read_entry, entry)
+                            for _, entry in zip(range(PACKAGE_READ_WORKERS * 2), remaining))
+            while pending:
+                zinfo, data = pending.popleft().result()
+                next_entry = next(remaining, None)
+                if next_entry is not None:
+                    pending.append(pool.submit(read_entry, next_entry))
+                
+                if os.path.splitext(zinfo.filename)[1].lower() in STORED_EXTENSIONS:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(zinfo, data, compress_type=compress_type)
+        
+        return zip_buffer, len(entries)
     
     def _install_python_deps(self, package_dir):
         """Install Python dependencies"""
         requirements_file = os.path.join(package_dir, "requirements.txt")
         if os.path.exists(requirements_file):
-            self.print_status('info', "Installing Python packages...")
-            try:
-                subprocess.run([
-                    sys.executable, "-m", "pip", "install", 
-                    "-r", requirements_file, 
-                    "-t", package_dir,
-                    "--no-deps", "--upgrade"
-                ], check=True, capture_output=True)
-                self.print_status('success', "Python dependencies installed")
-            except subprocess.CalledProcessError as e:
-                self.print_status('warning', f"Some dependencies failed to install: {e}")
+            import shutil
+            import subprocess
+            
+            # Same requirements on the same interpreter give the same packages
+            with open(requirements_file, 'rb') as f:
+                key = hashlib.sha256(f.read() + f"{sys.version_info[:2]}{sys.platform}".encode()).hexdigest()
+            deps_dir = DEPS_CACHE_DIR / key
+            
+            if self.use_cache and not self.refresh and deps_dir.is_dir():
+                self.print_status('info', "Reusing Python packages from a previous deploy")
+            else:
+                self.print_status('info', "Installing Python packages...")
+                DEPS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                install_dir = DEPS_CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+                try:
+                    subprocess.run([
+                        sys.executable, "-m", "pip", "install", 
+                        "-r", requirements_file, 
+                        "-t", str(install_dir),
+                        "--no-deps", "--upgrade",
+                        "--no-compile", "--prefer-binary",
+                        "--cache-dir", str(PIP_CACHE_DIR)
+                    ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                       env={**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1', 'PIP_NO_COLOR': '1'})
+                    self.print_status('success', "Python dependencies installed")
+                    if not self.use_cache:
+                        deps_dir = install_dir
+                    else:
+                        # --refresh replaces the cached set, picking up new releases of unpinned requirements
+                        if self.refresh:
+                            shutil.rmtree(deps_dir, ignore_errors=True)
+                        try:
+                            os.replace(install_dir, deps_dir)
+                        except OSError:
+                            # A concurrent deploy stored the same set first; ship this one
+                            deps_dir = install_dir
+                except subprocess.CalledProcessError as e:
+                    # Ship whatever did install, but never cache a partial set
+                    self.print_status('warning', f"Some dependencies failed to install: {_last_line(e.stderr)}")
+                    deps_dir = install_dir
+            
+            if deps_dir.is_dir():
+                shutil.copytree(deps_dir, package_dir, dirs_exist_ok=True,
+                                copy_function=_link_or_copy)
+            if deps_dir.name.endswith('.tmp'):
+                shutil.rmtree(deps_dir, ignore_errors=True)
         else:
             self.print_status('info', "No requirements.txt found, skipping dependency installation")
     
@@ -493,14 +1061,18 @@ class VajraCLI:
         """Install Node.js dependencies"""
         package_json = os.path.join(package_dir, "package.json")
         if os.path.exists(package_json):
+            import subprocess
+            
             self.print_status('info', "Installing Node.js packages...")
             try:
                 subprocess.run([
                     "npm", "install", "--production"
-                ], cwd=package_dir, check=True, capture_output=True)
+                ], cwd=package_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                   env={**os.environ, 'npm_config_audit': 'false', 'npm_config_fund': 'false',
+                        'npm_config_update_notifier': 'false'})
                 self.print_status('success', "Node.js dependencies installed")
             except subprocess.CalledProcessError as e:
-                self.print_status('warning', f"Some dependencies failed to install: {e}")
+                self.print_status('warning', f"Some dependencies failed to install: {_last_line(e.stderr)}")
         else:
             self.print_status('info', "No package.json found, skipping dependency installation")
     
@@ -510,33 +1082,37 @@ class VajraCLI:
             
         self.print_section("FUNCTION INVOCATION")
         
-        print(f"  Function Name    : {name}")
-        print(f"  Test Mode        : {'Yes' if test_mode else 'No'}")
-        print(f"  Payload Size     : {len(json.dumps(payload or {}))} bytes")
-        print(f"  User             : {self.config.get('user_email', 'Unknown')}")
+        # Encode the payload once; the size line and the request body share it
+        payload_json = _dumpb(payload or {})
+        body = b''.join((b'{"payload":', payload_json,
+                         b',"test_mode":', b'true' if test_mode else b'false', b'}'))
         
-        data = {
-            "payload": payload or {},
-            "test_mode": test_mode
-        }
+        sys.stdout.write(
+            f"  Function Name    : {name}\n"
+            f"  Test Mode        : {'Yes' if test_mode else 'No'}\n"
+            f"  Payload Size     : {len(payload_json)} bytes\n"
+            f"  User             : {self.config.get('user_email', 'Unknown')}\n"
+        )
         
         self.print_status('progress', "Invoking function...")
         
         try:
-            headers = self.get_auth_headers()
             start_time = time.time()
-            response = requests.post(f"{self.api_base}/functions/{name}/invoke", 
-                                   json=data, headers=headers)
+            response = self.session.post(f"{self.api_base}/functions/{name}/invoke", 
+                                         data=body,
+                                         headers={'Content-Type': 'application/json'})
             end_time = time.time()
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 self.print_status('success', "Function executed successfully")
-                print(f"  Execution Time   : {result.get('execution_time', 'N/A')}")
-                print(f"  Memory Used      : {result.get('memory_used', 'N/A')}")
-                print(f"  Total Latency    : {(end_time - start_time)*1000:.2f}ms")
-                print(f"  Result           :")
-                print(f"    {json.dumps(result['result'], indent=4)}")
+                sys.stdout.write(
+                    f"  Execution Time   : {result.get('execution_time', 'N/A')}\n"
+                    f"  Memory Used      : {result.get('memory_used', 'N/A')}\n"
+                    f"  Total Latency    : {(end_time - start_time)*1000:.2f}ms\n"
+                    f"  Result           :\n"
+                    f"    {_format_json(result['result'])}\n"
+                )
                 self.print_end_section()
                 return result
             else:
@@ -556,68 +1132,221 @@ class VajraCLI:
         self.print_section("FUNCTION LIST")
         
         try:
-            headers = self.get_auth_headers()
-            response = requests.get(f"{self.api_base}/functions", headers=headers)
-            
-            if response.status_code == 200:
-                result = response.json()
-                functions = result['functions']
-                
-                if functions:
-                    print(f"  Total Functions  : {result['total']}")
-                    print(f"  Data Source      : {result['source']}")
-                    print(f"  User             : {result['user']}")
-                    print()
-                    
-                    for func in functions:
-                        print(f"  * {func['name']}")
-                        print(f"     Runtime       : {func['runtime']}")
-                        print(f"     Status        : {func['status']}")
-                        print(f"     Version       : {func['version']}")
-                        print(f"     Invocations   : {func['invocation_count']}")
-                        print(f"     Created       : {func['created_at']}")
-                        if func.get('description'):
-                            print(f"     Description   : {func['description']}")
-                        print()
-                else:
-                    self.print_status('info', "No functions found")
-                    
-                self.print_end_section()
-                return result
-            else:
-                self.print_status('error', f"Failed to list functions: {response.text}")
+            result, error = self.cached_get(f"{self.api_base}/functions")
+            if error is not None:
+                self.print_status('error', f"Failed to list functions: {error}")
                 self.print_end_section()
                 return None
+            
+            functions = result['functions']
+            
+            if functions:
+                sys.stdout.write(
+                    f"  Total Functions  : {result['total']}\n"
+                    f"  Data Source      : {result['source']}\n"
+                    f"  User             : {result['user']}\n\n"
+                    + "\n".join(
+                        _FUNCTION_FMT % func
+                        + (_DESCRIPTION_FMT % func['description'] if func.get('description') else "")
+                        for func in functions
+                    )
+                    + "\n"
+                )
+            else:
+                self.print_status('info', "No functions found")
                 
+            self.print_end_section()
+            return result
+
         except Exception as e:
             self.print_status('error', f"Error: {str(e)}")
             self.print_end_section()
             return None
 
-    def detect_runtime(self, path):
-        if os.path.exists(os.path.join(path, "requirements.txt")) or \
-           any(f.endswith('.py') for f in os.listdir(path)):
-            return "python3.11"
-        elif os.path.exists(os.path.join(path, "package.json")):
-            return "nodejs18"
-        elif any(f.endswith('.go') for f in os.listdir(path)):
-            return "go1.21"
-        elif any(f.endswith('.java') for f in os.listdir(path)):
-            return "java17"
+    def get_logs(self, name, limit=50, cursor=None):
+        if not self.check_auth():
+            return None
+        
+        self.print_section("FUNCTION LOGS")
+        
+        params = {'limit': limit}
+        if cursor:
+            params['cursor'] = cursor
+        
+        try:
+            with self.session.get(f"{self.api_base}/functions/{name}/logs",
+                                  params=params, stream=True,
+                                  headers={'Accept': 'application/x-ndjson, application/json'}) as response:
+                if response.status_code != 200:
+                    self.print_status('error', f"Failed to get logs: {response.text}")
+                    self.print_end_section()
+                    return None
+                
+                # NDJSON responses are printed line by line as they arrive
+                if response.headers.get('Content-Type', '').startswith('application/x-ndjson'):
+                    for line in response.iter_lines():
+                        if line:
+                            self._print_log_entry(_loads(line))
+                    next_cursor = response.headers.get('X-Next-Cursor')
+                else:
+                    result = _loads(response.content)
+                    for entry in result.get('logs', []):
+                        self._print_log_entry(entry)
+                    next_cursor = result.get('next_cursor')
+            
+            if next_cursor:
+                print()
+                print(f"  More logs: vajra logs {name} --cursor {next_cursor}")
+            self.print_end_section()
+            return next_cursor
+            
+        except Exception as e:
+            self.print_status('error', f"Error: {str(e)}")
+            self.print_end_section()
+            return None
+    
+    def _print_log_entry(self, entry):
+        print(f"  {entry.get('timestamp', '')} [{entry.get('level', 'INFO')}] {entry.get('message', '')}")
+
+    def delete_function(self, name, force=False):
+        if not self.check_auth():
+            return False
+        if not force:
+            confirm = input(f"Delete function '{name}'? (yes/no): ")
+            if confirm.lower() != 'yes':
+                print("Cancelled")
+                return False
+        try:
+            response = self.session.delete(f"{self.api_base}/functions/{name}")
+            if response.status_code == 200:
+                self.invalidate_function_cache(name)
+                print(f"[OK] Function '{name}' deleted successfully")
+                return True
+            else:
+                print(f"Error: {response.text}")
+        except Exception as e:
+            print(f"Error: {str(e)}")
+        return False
+
+    def get_function_details(self, names):
+        import asyncio
+        
+        if not self.check_auth():
+            return None
+        
+        urls = [self._details_url(name) for name in names]
+        
+        # Names missing from the cache are fetched in one batch call where the
+        # gateway supports it, otherwise concurrently over the pooled session
+        if self.refresh:
+            stale = list(names)
         else:
-            return "python3.11"
-def main():
+            stale = [name for name, url in zip(names, urls)
+                     if self.read_cache(self._cache_file(url), DETAILS_CACHE_TTL) is None]
+        try:
+            batched = self._batch_get(stale) if len(stale) > 1 else None
+            if batched is None:
+                responses = asyncio.run(self._get_all(urls))
+            else:
+                responses = [batched.get(name) or self.cached_get(url, ttl=DETAILS_CACHE_TTL)
+                             for name, url in zip(names, urls)]
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            return None
+        
+        # Collect every function's block and write the report in one go
+        results = []
+        lines = []
+        for response in responses:
+            if isinstance(response, Exception):
+                lines.append(f"Error: {str(response)}")
+                continue
+            result, error = response
+            if error is None:
+                func = result['function']
+                lines.append(
+                    f"\n* {func['name']}\n"
+                    f"   Runtime: {func['runtime']}\n"
+                    f"   Status: {func['status']}\n"
+                    f"   Memory: {func['memory']}MB\n"
+                    f"   Invocations: {func['invocation_count']}"
+                )
+                results.append(result)
+            else:
+                lines.append(f"Error: {error}")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        return results
+    
+    def _batch_get(self, names):
+        """Fetch details with POST /functions:batchGet, returning {name: (result, error)},
+        or None when the gateway has no batch endpoint
+        """
+        results = {}
+        for i in range(0, len(names), BATCH_GET_SIZE):
+            chunk = names[i:i + BATCH_GET_SIZE]
+            response = self.session.post(f"{self.api_base}/functions:batchGet",
+                                         data=_dumps({'names': chunk, 'fields': ['function']}),
+                                         headers={'Content-Type': 'application/json'})
+            if response.status_code in (404, 405):
+                return None
+            if response.status_code != 200:
+                results.update((name, (None, response.text)) for name in chunk)
+                continue
+            
+            body = _loads(response.content)
+            for result in body.get('functions', []):
+                name = result['function']['name']
+                results[name] = (result, None)
+                if self.use_cache:
+                    self.write_cache(self._cache_file(self._details_url(name)), result)
+            for name in body.get('missing', []):
+                results[name] = (None, f"Function '{name}' not found")
+        return results
+    
+    async def _get_all(self, urls):
+        """GET several URLs in parallel through the cache, returning results in order"""
+        import asyncio
+        
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.cached_get, url, DETAILS_CACHE_TTL) for url in urls),
+            return_exceptions=True
+        )
+
+    def detect_runtime(self, path):
+        return _detect_runtime(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+@functools.cache
+def _build_parser():
     parser = argparse.ArgumentParser(description='Vajra Serverless Platform CLI')
+    parser.add_argument('--version', action='version', version=f'vajra-cli {VERSION}')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the local response cache')
+    parser.add_argument('--refresh', action='store_true', help='Revalidate cached responses with the API')
+    parser.add_argument('--max-retries', type=int, default=3, help='Retries for failed or throttled requests')
+    parser.add_argument('--no-banner', action='store_true', help='Do not print the banner')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
+    subparsers.add_parser('version', help='Show the CLI version')
     subparsers.add_parser('init', help='Initialize authentication')
     subparsers.add_parser('logout', help='Logout and clear authentication')
     subparsers.add_parser('whoami', help='Show current user')
-    subparsers.add_parser('list', help='List all functions')
+    list_parser = subparsers.add_parser('list', help='List all functions')
+    list_parser.add_argument('--details', action='store_true', help='Also show details for every function')
+    
+    # Local cache management
+    cache_parser = subparsers.add_parser('cache', help='Manage the local response cache')
+    cache_parser.add_argument('action', choices=['clear'], help='Cache action')
     
     # Function details
     details_parser = subparsers.add_parser('details', help='Get function details')
-    details_parser.add_argument('name', help='Function name')
+    details_parser.add_argument('names', nargs='*', help='Function name(s)')
+    details_parser.add_argument('--all', action='store_true', help='Show every deployed function')
+    
+    # Function logs
+    logs_parser = subparsers.add_parser('logs', help='Show function logs')
+    logs_parser.add_argument('name', help='Function name')
+    logs_parser.add_argument('--limit', type=int, default=50, help='Maximum number of entries')
+    logs_parser.add_argument('--cursor', help='Continue from a previous page')
     
     # Function deletion
     delete_parser = subparsers.add_parser('delete', help='Delete a function')
@@ -638,79 +1367,105 @@ def main():
     invoke_parser.add_argument('--payload', help='JSON payload')
     invoke_parser.add_argument('--test', action='store_true', help='Enable test mode')
     
-    args = parser.parse_args()
-    
-    cli = VajraCLI()
+    return parser
+
+def _clear_cache(cli, args):
+    import shutil
     
-    if args.command == 'init':
-        cli.print_banner()
-        cli.init_auth()
-    elif args.command == 'logout':
-        cli.print_banner()
-        cli.logout()
-    elif args.command == 'whoami':
-        cli.print_banner()
-        cli.whoami()
-    elif args.command == 'list':
-        cli.print_banner()
-        cli.list_functions()
-    elif args.command == 'details':
-        cli.print_banner()
-        # Add simple details method
-        if not cli.check_auth():
-            return
+    cli.clear_cache()
+    shutil.rmtree(DEPS_CACHE_DIR, ignore_errors=True)
+    print("[OK] Local cache cleared")
+
+def _details(cli, args):
+    names = args.names
+    if args.all:
         try:
-            headers = cli.get_auth_headers()
-            response = requests.get(f"{cli.api_base}/functions/{args.name}", headers=headers)
-            if response.status_code == 200:
-                result = response.json()
-                func = result['function']
-                print(f"\n* {func['name']}")
-                print(f"   Runtime: {func['runtime']}")
-                print(f"   Status: {func['status']}")
-                print(f"   Memory: {func['memory']}MB")
-                print(f"   Invocations: {func['invocation_count']}")
-            else:
-                print(f"Error: {response.text}")
+            result, error = cli.cached_get(f"{cli.api_base}/functions")
         except Exception as e:
-            print(f"Error: {str(e)}")
-    elif args.command == 'delete':
-        cli.print_banner()
-        # Add simple delete method
-        if not cli.check_auth():
+            error = str(e)
+        if error is not None:
+            print(f"Error: {error}")
             return
-        if not args.force:
-            confirm = input(f"Delete function '{args.name}'? (yes/no): ")
-            if confirm.lower() != 'yes':
-                print("Cancelled")
-                return
-        try:
-            headers = cli.get_auth_headers()
-            response = requests.delete(f"{cli.api_base}/functions/{args.name}", headers=headers)
-            if response.status_code == 200:
-                print(f"[OK] Function '{args.name}' deleted successfully")
-            else:
-                print(f"Error: {response.text}")
-        except Exception as e:
-            print(f"Error: {str(e)}")
-    elif args.command == 'deploy':
-        cli.print_banner()
-        cli.deploy_function(
-            name=args.name,
-            path=args.path,
-            runtime=args.runtime,
-            handler=args.handler,
-            memory=args.memory,
-            timeout=args.timeout,
-            description=args.description
-        )
-    elif args.command == 'invoke':
-        cli.print_banner()
-        payload = json.loads(args.payload) if args.payload else {}
-        cli.invoke_function(args.name, payload, args.test)
-    else:
-        cli.print_banner()
+        names = [func['name'] for func in result['functions']]
+    if not names:
+        print("Error: give at least one function name, or --all")
+        return
+    cli.get_function_details(names)
+
+def _list(cli, args):
+    result = cli.list_functions()
+    if args.details and result and result['functions']:
+        cli.get_function_details([func['name'] for func in result['functions']])
+
+def _invoke(cli, args):
+    payload = _loads(args.payload) if args.payload else {}
+    cli.invoke_function(args.name, payload, args.test)
+
+def _deploy(cli, args):
+    cli.deploy_function(
+        name=args.name,
+        path=args.path,
+        runtime=args.runtime,
+        handler=args.handler,
+        memory=args.memory,
+        timeout=args.timeout,
+        description=args.description
+    )
+
+# Commands that always reach the API, so connecting early never wastes a request
+PREWARM_COMMANDS = {'init', 'whoami', 'logs', 'delete', 'deploy', 'invoke'}
+
+COMMANDS = {
+    'version': lambda cli, args: sys.stdout.write(f"vajra-cli {VERSION}\n"),
+    'init': lambda cli, args: cli.init_auth(),
+    'logout': lambda cli, args: cli.logout(),
+    'whoami': lambda cli, args: cli.whoami(),
+    'list': _list,
+    'cache': _clear_cache,
+    'details': _details,
+    'logs': lambda cli, args: cli.get_logs(args.name, args.limit, args.cursor),
+    'delete': lambda cli, args: cli.delete_function(args.name, args.force),
+    'deploy': _deploy,
+    'invoke': _invoke,
+}
+
+def _is_version_query(argv):
+    """Check whether argv asks for the version alone, ignoring global flags"""
+    rest = []
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--no-banner', '--no-cache', '--refresh') or arg.startswith('--max-retries='):
+            continue
+        if arg == '--max-retries':
+            next(args, None)
+            continue
+        rest.append(arg)
+    return rest in (['version'], ['--version'])
+
+def main():
+    # Answer version queries before building the parser or touching the config
+    if _is_version_query(sys.argv[1:]):
+        sys.stdout.write(f"vajra-cli {VERSION}\n")
+        return
+    
+    parser = _build_parser()
+    args = parser.parse_args()
+    
+    cli = VajraCLI()
+    cli.use_cache = not args.no_cache
+    cli.refresh = args.refresh
+    cli.max_retries = args.max_retries
+    if args.command in PREWARM_COMMANDS:
+        cli.prewarm()
+    
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
+        return
+    # Piped output is for other tools, not people
+    if not args.no_banner and sys.stdout.isatty():
+        cli.print_banner()
+    handler(cli, args)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
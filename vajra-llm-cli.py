@@ -4,23 +4,41 @@ Vajra LLM Platform CLI
 Command-line interface for managing LLM models, adapters, fine-tuning, and inference.
 """
 
-import requests
 import os
 import sys
 import json
 import time
 import argparse
-from datetime import datetime
+import functools
+import hashlib
+from pathlib import Path
+from urllib.parse import urlencode
 
 # Default to local development server
 API_BASE = os.environ.get("VAJRA_API_URL", "http://localhost:8000")
 
-class VajraLLMCLI:
-    def __init__(self):
-        self.api_base = API_BASE
+# (connect, read) timeouts; completions get longer to generate
+REQUEST_TIMEOUT = (3.05, 30)
+CHAT_TIMEOUT = (3.05, 120)
+# Keep-alive connections pooled per host; chat-bench runs at most this many requests at once
+POOL_SIZE = 10
+
+# Catalog responses are cached here, shared with vajra-cli.py's config directory
+CACHE_DIR = Path.home() / ".vajra"
+
+# orjson parses straight from response bytes when it is installed
+try:
+    import orjson
     
-    def print_banner(self):
-        banner = """
+    _dumpb = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumpb(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    _loads = json.loads
+
+_BANNER = """
 ┌─────────────────────────────────────────────────────────────────┐
 │                                                                 │
 │  ██╗   ██╗ █████╗      ██╗██████╗  █████╗                      │
@@ -34,304 +52,639 @@ class VajraLLMCLI:
 │                        Version 1.0.0                            │
 │                                                                 │
 └─────────────────────────────────────────────────────────────────┘
-        """
-        print(banner)
+
+"""
+_SECTION_RULE = "─" * 60
+_SECTION_END = "└" + "─" * 62 + "┘\n"
+_STATUS_SYMBOLS = {
+    'success': '[OK]',
+    'error': '[ERROR]',
+    'warning': '[WARN]',
+    'info': '[INFO]',
+}
+
+# Per-item templates for the list views, each written with a single stdout call
+_MODEL_FMT = (
+    "  %(icon)s %(name)s\n"
+    "     ID         : %(id)s\n"
+    "     Parameters : %(parameters)s\n"
+    "     GPU        : %(gpu_count)sx %(gpu_type)s\n"
+    "     Status     : %(status)s\n"
+    "     Latency    : %(avg_latency_ms)sms\n"
+    "     Instances  : %(warm_instances)s/%(max_instances)s\n\n"
+)
+_ADAPTER_FMT = (
+    "  %(icon)s %(name)s\n"
+    "     Type       : %(type)s\n"
+    "     Base Model : %(base_model)s\n"
+    "     Rank       : %(rank)s\n"
+    "     Status     : %(status)s\n"
+)
+_GPU_POOL_FMT = (
+    "  %(gpu_type)s\n"
+    "     [%(bar)s] %(utilization).0f%%\n"
+    "     Total    : %(total)s\n"
+    "     In Use   : %(in_use)s\n"
+    "     Available: %(available)s\n"
+    "     Cost     : $%(cost_per_hour)s/hr\n"
+    "     Regions  : %(region_list)s\n\n"
+)
+_JOB_FMT = (
+    "  %(icon)s %(label)s\n"
+    "     ID       : %(id)s\n"
+    "     Model    : %(model)s\n"
+    "     Type     : %(type)s\n"
+    "     Status   : %(status_upper)s\n"
+    "     Progress : %(progress_pct).0f%%\n"
+    "     GPU      : %(gpu_count)sx %(gpu_type)s\n"
+)
+_BENCH_FMT = "  %-24s %9s %10s %7s %12s\n"
+# Fine-tuning jobs are listed this many to a page
+_JOB_PAGE_SIZE = 50
+# Fine-tuning jobs are polled until they reach one of these, at most this many seconds apart
+_JOB_FINAL_STATUSES = ('completed', 'failed', 'cancelled')
+_JOB_POLL_MAX = 30
+_JOB_ICONS = {
+    'running': '▶',
+    'queued': '◌',
+    'completed': '✓',
+    'failed': '✗',
+    'cancelled': '○'
+}
+
+def _jobs_path(limit=None, cursor=None):
+    """API path for the page of jobs after cursor, holding at most limit of them (None: a full page)"""
+    params = {'limit': _JOB_PAGE_SIZE if limit is None else min(limit, _JOB_PAGE_SIZE)}
+    if cursor:
+        params['cursor'] = cursor
+    return f"/v1/fine-tuning/jobs?{urlencode(params)}"
+
+def _api_call(title):
+    """Run a command inside its section, reporting request failures there"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            import requests
+            
+            self.print_section(title)
+            try:
+                return method(self, *args, **kwargs)
+            except requests.exceptions.ConnectionError:
+                self.print_status('error', f"Cannot connect to {self.api_base}")
+                self.print_status('info', "Make sure the backend is running:")
+                sys.stdout.write("  cd vajra-serverless/api-gateway\n"
+                                 "  python -m uvicorn main_llm:app --host 0.0.0.0 --port 8000\n")
+            except Exception as e:
+                self.print_status('error', f"Error: {str(e)}")
+            finally:
+                self.print_end_section()
+        return wrapper
+    return decorator
+
+class VajraLLMCLI:
+    def __init__(self):
+        self.api_base = API_BASE
+        self.use_cache = True
+        self.refresh = False
+        # Requests started by prefetch(), by command
+        self._pending = {}
+        self._session = None
+    
+    @property
+    def session(self):
+        """Pooled HTTP session, created on first use so --help and cached views never import requests"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # One pooled keep-alive session for every call. Reads retry with backoff on
+            # connection errors and gateway errors; chat and create-job never resubmit.
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=POOL_SIZE,
+                                  max_retries=Retry(total=4, connect=3, read=2, status=3,
+                                                    backoff_factor=0.5,
+                                                    status_forcelist=(502, 503, 504),
+                                                    allowed_methods=frozenset(["GET", "HEAD"]),
+                                                    raise_on_status=False))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+    
+    def print_banner(self):
+        sys.stdout.write(_BANNER)
     
     def print_section(self, title):
-        print(f"\n┌─ {title} " + "─" * (60 - len(title)) + "┐")
+        sys.stdout.write(f"\n┌─ {title} {_SECTION_RULE[len(title):]}┐\n")
     
     def print_end_section(self):
-        print("└" + "─" * 62 + "┘")
+        sys.stdout.write(_SECTION_END)
     
     def print_status(self, status, message):
-        symbols = {
-            'success': '[OK]',
-            'error': '[ERROR]',
-            'warning': '[WARN]',
-            'info': '[INFO]',
-        }
-        symbol = symbols.get(status, '[INFO]')
-        print(f"  {symbol} {message}")
+        symbol = _STATUS_SYMBOLS.get(status, '[INFO]')
+        sys.stdout.write(f"  {symbol} {message}\n")
     
+    @_api_call("HEALTH CHECK")
     def health_check(self):
         """Check API health"""
-        self.print_section("HEALTH CHECK")
+        pending = self._pending.pop('health', None)
+        response = pending.result() if pending else self.session.get(f"{self.api_base}/health", timeout=5)
+        if response.status_code == 200:
+            data = _loads(response.content)
+            self.print_status('success', f"Status: {data['status']}")
+            sys.stdout.write(f"  API URL: {self.api_base}\n"
+                             f"  Timestamp: {data['timestamp']}\n")
+        else:
+            self.print_status('error', f"Health check failed: {response.status_code}")
+    
+    def prefetch(self, command, path=None):
+        """Start the request behind health or a list command in the background,
+        for the command to pick up instead of fetching it again. path overrides the
+        section's API path when command options change the request.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        pool = ThreadPoolExecutor(max_workers=1)
+        if command == 'health':
+            self._pending[command] = pool.submit(self.session.get, f"{self.api_base}/health", timeout=5)
+        else:
+            _, section_path, _, ttl = SECTIONS[command]
+            self._pending[command] = pool.submit(self._fetch, path or section_path, ttl)
+        pool.shutdown(wait=False)
+    
+    def _cache_file(self, url):
+        return CACHE_DIR / f"llm_cache_{hashlib.sha1(url.encode()).hexdigest()}.json"
+    
+    def _load_cache_entry(self, cache_file):
+        if not self.use_cache:
+            return None
         try:
-            response = requests.get(f"{self.api_base}/health", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                self.print_status('success', f"Status: {data['status']}")
-                print(f"  API URL: {self.api_base}")
-                print(f"  Timestamp: {data['timestamp']}")
-            else:
-                self.print_status('error', f"Health check failed: {response.status_code}")
-        except requests.exceptions.ConnectionError:
-            self.print_status('error', f"Cannot connect to {self.api_base}")
-            self.print_status('info', "Make sure the backend is running:")
-            print("  cd vajra-serverless/api-gateway")
-            print("  python -m uvicorn main_llm:app --host 0.0.0.0 --port 8000")
+            with open(cache_file, 'rb') as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, cache_file, data):
+        if not self.use_cache:
+            return
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Swap the new entry in whole, so a concurrent reader never sees half a file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumpb({'timestamp': time.time(), 'data': data}))
+        os.replace(tmp_file, cache_file)
+    
+    def _fetch(self, path, ttl=None):
+        """GET an API path, through the local cache when ttl is set.
+        Returns (data, None), (None, error) or, when the API is unreachable, (stale data, warning).
+        """
+        url = f"{self.api_base}{path}"
+        cache_file = self._cache_file(url)
+        entry = self._load_cache_entry(cache_file) if ttl else None
+        if entry and not self.refresh and time.time() - entry['timestamp'] < ttl:
+            return entry['data'], None
+        
+        import requests
+        
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                return None, f"Failed: {response.text}"
+            data = _loads(response.content)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if entry:
+                return entry['data'], "API unreachable, serving stale cache"
+            return None, f"Error: {str(e)}"
         except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
+            return None, f"Error: {str(e)}"
+        
+        if ttl:
+            self._write_cache(cache_file, data)
+        return data, None
+    
+    def _show(self, command, result=None):
+        """Print the section for a list command, fetching it unless a _fetch result is given"""
+        title, path, render, ttl = SECTIONS[command]
+        if result is None:
+            pending = self._pending.pop(command, None)
+            result = pending.result() if pending else self._fetch(path, ttl)
+        data, error = result
+        
+        self.print_section(title)
+        if data is None:
+            self.print_status('error', error)
+        else:
+            if error:
+                self.print_status('warning', error)
+            try:
+                getattr(self, render)(data)
+            except Exception as e:
+                self.print_status('error', f"Error: {str(e)}")
         self.print_end_section()
     
     def list_models(self):
         """List all available LLM models"""
-        self.print_section("AVAILABLE MODELS")
-        try:
-            response = requests.get(f"{self.api_base}/v1/models")
-            if response.status_code == 200:
-                data = response.json()
-                models = data.get('data', [])
-                print(f"  Total Models: {len(models)}\n")
-                
-                for model in models:
-                    status_icon = "●" if model['status'] == 'deployed' else "○"
-                    status_color = "deployed" if model['status'] == 'deployed' else model['status']
-                    print(f"  {status_icon} {model['name']}")
-                    print(f"     ID         : {model['id']}")
-                    print(f"     Parameters : {model['parameters']}")
-                    print(f"     GPU        : {model['gpu_count']}x {model['gpu_type']}")
-                    print(f"     Status     : {status_color}")
-                    print(f"     Latency    : {model['avg_latency_ms']}ms")
-                    print(f"     Instances  : {model['warm_instances']}/{model['max_instances']}")
-                    print()
-            else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+        self._show('models')
     
     def list_adapters(self):
         """List all adapters (LoRA/QLoRA)"""
-        self.print_section("ADAPTERS")
-        try:
-            response = requests.get(f"{self.api_base}/v1/adapters")
-            if response.status_code == 200:
-                data = response.json()
-                adapters = data.get('data', [])
-                print(f"  Total Adapters: {len(adapters)}\n")
-                
-                for adapter in adapters:
-                    status_icon = "●" if adapter['status'] == 'active' else "○"
-                    print(f"  {status_icon} {adapter['name']}")
-                    print(f"     Type       : {adapter['type'].upper()}")
-                    print(f"     Base Model : {adapter['base_model']}")
-                    print(f"     Rank       : {adapter['rank']}")
-                    print(f"     Status     : {adapter['status']}")
-                    if adapter.get('accuracy'):
-                        print(f"     Accuracy   : {adapter['accuracy']*100:.1f}%")
-                    print()
-            else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+        self._show('adapters')
     
     def list_gpu_pools(self):
         """List GPU pools"""
-        self.print_section("GPU POOLS")
-        try:
-            response = requests.get(f"{self.api_base}/v1/gpu/pools")
-            if response.status_code == 200:
-                data = response.json()
-                pools = data.get('pools', {})
-                print(f"  Total GPUs: {data.get('total_gpus', 0)}")
-                print(f"  Available : {data.get('available_gpus', 0)}\n")
-                
-                for name, pool in pools.items():
-                    utilization = (pool['in_use'] / pool['total']) * 100
-                    bar_len = 20
-                    filled = int(bar_len * pool['in_use'] / pool['total'])
-                    bar = "█" * filled + "░" * (bar_len - filled)
-                    
-                    print(f"  {pool['gpu_type']}")
-                    print(f"     [{bar}] {utilization:.0f}%")
-                    print(f"     Total    : {pool['total']}")
-                    print(f"     In Use   : {pool['in_use']}")
-                    print(f"     Available: {pool['available']}")
-                    print(f"     Cost     : ${pool['cost_per_hour']}/hr")
-                    print(f"     Regions  : {', '.join(pool['regions'])}")
-                    print()
-            else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+        self._show('gpu')
     
-    def list_jobs(self):
-        """List fine-tuning jobs"""
-        self.print_section("FINE-TUNING JOBS")
+    def list_jobs(self, limit=_JOB_PAGE_SIZE):
+        """List up to limit fine-tuning jobs (None: all of them), writing each page as it arrives"""
+        pending = self._pending.pop('jobs', None)
+        data, error = pending.result() if pending else self._fetch(_jobs_path(limit))
+        
+        self.print_section(SECTIONS['jobs'][0])
+        shown, total, cursor = 0, 0, None
         try:
-            response = requests.get(f"{self.api_base}/v1/fine-tuning/jobs")
-            if response.status_code == 200:
-                data = response.json()
+            while True:
+                if data is None:
+                    self.print_status('error', error)
+                    break
+                if error:
+                    self.print_status('warning', error)
                 jobs = data.get('data', [])
-                print(f"  Total Jobs: {len(jobs)}\n")
-                
-                status_icons = {
-                    'running': '▶',
-                    'queued': '◌',
-                    'completed': '✓',
-                    'failed': '✗',
-                    'cancelled': '○'
-                }
-                
-                for job in jobs:
-                    icon = status_icons.get(job['status'], '?')
-                    print(f"  {icon} {job.get('adapter_name', job.get('adapter', 'Unnamed'))}")
-                    print(f"     ID       : {job['id']}")
-                    print(f"     Model    : {job['model']}")
-                    print(f"     Type     : {job['type']}")
-                    print(f"     Status   : {job['status'].upper()}")
-                    print(f"     Progress : {job['progress']*100:.0f}%")
-                    print(f"     GPU      : {job['gpu_count']}x {job['gpu_type']}")
-                    if job.get('cost_so_far'):
-                        print(f"     Cost     : ${job['cost_so_far']:.2f}")
-                    print()
-            else:
-                self.print_status('error', f"Failed: {response.text}")
+                if limit is not None:
+                    jobs = jobs[:limit - shown]
+                if not shown:
+                    total = data.get('total', len(jobs))
+                    sys.stdout.write(f"  Total Jobs: {total}\n\n")
+                sys.stdout.write(self._format_jobs(jobs))
+                sys.stdout.flush()
+                shown += len(jobs)
+                cursor = data.get('next_cursor')
+                if not cursor or (limit is not None and shown >= limit):
+                    break
+                data, error = self._fetch(_jobs_path(None if limit is None else limit - shown, cursor))
+            if cursor and shown < total:
+                self.print_status('info', f"Showing {shown} of {total} jobs; pass --all to list every job")
         except Exception as e:
             self.print_status('error', f"Error: {str(e)}")
         self.print_end_section()
     
     def get_usage(self):
         """Get usage statistics"""
-        self.print_section("USAGE STATISTICS")
-        try:
-            response = requests.get(f"{self.api_base}/v1/usage")
-            if response.status_code == 200:
-                data = response.json()
-                summary = data.get('summary', {})
-                
-                print(f"  Total Requests : {summary.get('total_requests', 0):,}")
-                print(f"  Total Tokens   : {summary.get('total_tokens', 0):,}")
-                print(f"  Total Cost     : ${summary.get('total_cost', 0):.2f}")
-                print(f"  GPU Hours      : {summary.get('gpu_hours', 0)}")
-                
-                print("\n  Usage by Model:")
-                for model in data.get('by_model', []):
-                    print(f"     {model['model']}: {model['requests']:,} requests, ${model['cost']:.2f}")
-            else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+        self._show('usage')
     
     def get_metrics(self):
         """Get real-time metrics"""
-        self.print_section("REAL-TIME METRICS")
+        self._show('metrics')
+    
+    def overview(self):
+        """Every list view from one /v1/overview request, as {command: _fetch result}.
+        Empty when the API has no overview endpoint or can't be reached.
+        """
         try:
-            response = requests.get(f"{self.api_base}/v1/metrics")
-            if response.status_code == 200:
-                data = response.json()
-                
-                inf = data.get('inference', {})
-                gpu = data.get('gpu', {})
-                scaling = data.get('scaling', {})
-                
-                print("  Inference:")
-                print(f"     Requests/sec : {inf.get('requests_per_second', 0):.1f}")
-                print(f"     P50 Latency  : {inf.get('p50_latency_ms', 0)}ms")
-                print(f"     P99 Latency  : {inf.get('p99_latency_ms', 0)}ms")
-                print(f"     Error Rate   : {inf.get('error_rate', 0)*100:.2f}%")
-                
-                print("\n  GPU:")
-                print(f"     Utilization  : {gpu.get('utilization', '0%')}")
-                print(f"     Memory Used  : {gpu.get('memory_used', '0%')}")
-                print(f"     Active GPUs  : {gpu.get('active_gpus', 0)}")
-                
-                print("\n  Scaling:")
-                print(f"     Warm Instances: {scaling.get('warm_instances', 0)}")
-                print(f"     Cold Starts   : {scaling.get('cold_starts_last_hour', 0)}")
-            else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+            response = self.session.get(f"{self.api_base}/v1/overview", timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                return {}
+            views = _loads(response.content)
+        except Exception:
+            return {}
+        
+        results = {}
+        for command, (_, path, _, ttl) in SECTIONS.items():
+            if command in views:
+                if ttl:
+                    self._write_cache(self._cache_file(f"{self.api_base}{path}"), views[command])
+                results[command] = (views[command], None)
+        return results
+    
+    def dashboard(self):
+        """Print every list view, from one overview request or else fetched in parallel"""
+        import asyncio
+        
+        results = self.overview()
+        missing = [command for command in SECTIONS if command not in results]
+        
+        async def fetch_all():
+            return await asyncio.gather(
+                *(asyncio.to_thread(self._fetch, SECTIONS[command][1], SECTIONS[command][3])
+                  for command in missing))
+        
+        if missing:
+            results.update(zip(missing, asyncio.run(fetch_all())))
+        for command in SECTIONS:
+            self._show(command, results[command])
+    
+    def _render_models(self, data):
+        models = data.get('data', [])
+        sys.stdout.write(
+            f"  Total Models: {len(models)}\n\n"
+            + "".join(_MODEL_FMT % {**model, 'icon': "●" if model['status'] == 'deployed' else "○"}
+                      for model in models)
+        )
+    
+    def _render_adapters(self, data):
+        adapters = data.get('data', [])
+        sys.stdout.write(
+            f"  Total Adapters: {len(adapters)}\n\n"
+            + "".join(
+                _ADAPTER_FMT % {**adapter, 'icon': "●" if adapter['status'] == 'active' else "○",
+                                'type': adapter['type'].upper()}
+                + (f"     Accuracy   : {adapter['accuracy']*100:.1f}%\n" if adapter.get('accuracy') else "")
+                + "\n"
+                for adapter in adapters
+            )
+        )
+    
+    def _render_gpu_pools(self, data):
+        bar_len = 20
+        rows = []
+        for pool in data.get('pools', {}).values():
+            filled = int(bar_len * pool['in_use'] / pool['total'])
+            rows.append(_GPU_POOL_FMT % {
+                **pool,
+                'bar': "█" * filled + "░" * (bar_len - filled),
+                'utilization': (pool['in_use'] / pool['total']) * 100,
+                'region_list': ', '.join(pool['regions'])
+            })
+        sys.stdout.write(
+            f"  Total GPUs: {data.get('total_gpus', 0)}\n"
+            f"  Available : {data.get('available_gpus', 0)}\n\n"
+            + "".join(rows)
+        )
+    
+    def _render_jobs(self, data):
+        jobs = data.get('data', [])
+        sys.stdout.write(f"  Total Jobs: {data.get('total', len(jobs))}\n\n" + self._format_jobs(jobs))
     
-    def chat(self, model, message, adapter=None):
+    def _format_jobs(self, jobs):
+        return "".join(
+            _JOB_FMT % {**job, 'icon': _JOB_ICONS.get(job['status'], '?'),
+                        'label': job.get('adapter_name', job.get('adapter', 'Unnamed')),
+                        'status_upper': job['status'].upper(),
+                        'progress_pct': job['progress'] * 100}
+            + (f"     Cost     : ${job['cost_so_far']:.2f}\n" if job.get('cost_so_far') else "")
+            + "\n"
+            for job in jobs
+        )
+    
+    def _render_usage(self, data):
+        summary = data.get('summary', {})
+        sys.stdout.write(
+            f"  Total Requests : {summary.get('total_requests', 0):,}\n"
+            f"  Total Tokens   : {summary.get('total_tokens', 0):,}\n"
+            f"  Total Cost     : ${summary.get('total_cost', 0):.2f}\n"
+            f"  GPU Hours      : {summary.get('gpu_hours', 0)}\n"
+            "\n  Usage by Model:\n"
+            + "".join(f"     {model['model']}: {model['requests']:,} requests, ${model['cost']:.2f}\n"
+                      for model in data.get('by_model', []))
+        )
+    
+    def _render_metrics(self, data):
+        inf = data.get('inference', {})
+        gpu = data.get('gpu', {})
+        scaling = data.get('scaling', {})
+        
+        sys.stdout.write(
+            "  Inference:\n"
+            f"     Requests/sec : {inf.get('requests_per_second', 0):.1f}\n"
+            f"     P50 Latency  : {inf.get('p50_latency_ms', 0)}ms\n"
+            f"     P99 Latency  : {inf.get('p99_latency_ms', 0)}ms\n"
+            f"     Error Rate   : {inf.get('error_rate', 0)*100:.2f}%\n"
+            "\n  GPU:\n"
+            f"     Utilization  : {gpu.get('utilization', '0%')}\n"
+            f"     Memory Used  : {gpu.get('memory_used', '0%')}\n"
+            f"     Active GPUs  : {gpu.get('active_gpus', 0)}\n"
+            "\n  Scaling:\n"
+            f"     Warm Instances: {scaling.get('warm_instances', 0)}\n"
+            f"     Cold Starts   : {scaling.get('cold_starts_last_hour', 0)}\n"
+        )
+    
+    @_api_call("CHAT COMPLETION")
+    def chat(self, model, message, adapter=None, stream=True):
         """Send a chat completion request"""
-        self.print_section("CHAT COMPLETION")
-        print(f"  Model   : {model}")
-        if adapter:
-            print(f"  Adapter : {adapter}")
-        print(f"  Message : {message[:50]}{'...' if len(message) > 50 else ''}")
-        print()
+        sys.stdout.write(
+            f"  Model   : {model}\n"
+            + (f"  Adapter : {adapter}\n" if adapter else "")
+            + f"  Message : {message[:50]}{'...' if len(message) > 50 else ''}\n\n"
+        )
         
-        try:
-            payload = {
-                "model": model,
-                "messages": [
-                    {"role": "user", "content": message}
-                ],
-                "max_tokens": 512,
-                "temperature": 0.7
-            }
-            if adapter:
-                payload["adapter"] = adapter
-            
-            start = time.time()
-            response = requests.post(f"{self.api_base}/v1/chat/completions", json=payload)
-            latency = (time.time() - start) * 1000
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                content = data['choices'][0]['message']['content']
-                usage = data.get('usage', {})
-                meta = data.get('meta', {})
-                
-                print("  Response:")
-                print("  " + "-" * 60)
-                for line in content.split('\n'):
-                    print(f"  {line}")
-                print("  " + "-" * 60)
-                print()
-                print(f"  Tokens     : {usage.get('total_tokens', 0)} (prompt: {usage.get('prompt_tokens', 0)}, completion: {usage.get('completion_tokens', 0)})")
-                print(f"  Latency    : {latency:.0f}ms (server: {meta.get('latency_ms', 0)}ms)")
-                print(f"  Cost       : ${meta.get('cost', 0):.6f}")
-                
-                self.print_status('success', "Completion successful")
+        start = time.time()
+        response = self._post_chat(model, message, adapter, stream)
+        
+        if response.status_code != 200:
+            self.print_status('error', f"Failed: {response.text}")
+            return
+        
+        rule = "  " + "-" * 60 + "\n"
+        sys.stdout.write("  Response:\n" + rule)
+        # Servers without streaming answer with the whole completion as JSON
+        if response.headers.get('Content-Type', '').startswith('text/event-stream'):
+            usage, meta, first_token = self._read_stream(response, start)
+        else:
+            data = _loads(response.content)
+            sys.stdout.write("".join(f"  {line}\n" for line in data['choices'][0]['message']['content'].split('\n')))
+            usage, meta, first_token = data.get('usage', {}), data.get('meta', {}), None
+        latency = (time.time() - start) * 1000
+        sys.stdout.write(
+            rule + "\n"
+            f"  Tokens     : {usage.get('total_tokens', 0)} (prompt: {usage.get('prompt_tokens', 0)}, completion: {usage.get('completion_tokens', 0)})\n"
+            + (f"  First Token: {first_token:.0f}ms\n" if first_token is not None else "")
+            + f"  Latency    : {latency:.0f}ms (server: {meta.get('latency_ms', 0)}ms)\n"
+            f"  Cost       : ${meta.get('cost', 0):.6f}\n"
+        )
+        self.print_status('success', "Completion successful")
+    
+    def _post_chat(self, model, message, adapter=None, stream=True):
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "user", "content": message}
+            ],
+            "max_tokens": 512,
+            "temperature": 0.7
+        }
+        if adapter:
+            payload["adapter"] = adapter
+        if stream:
+            payload["stream"] = True
+        return self.session.post(f"{self.api_base}/v1/chat/completions", data=_dumpb(payload),
+                                 headers={'Content-Type': 'application/json'},
+                                 stream=stream, timeout=CHAT_TIMEOUT)
+    
+    def _read_stream(self, response, start, echo=True):
+        """Read streamed chat tokens as they arrive, writing them out if echo is set.
+        Returns (usage, meta, milliseconds to the first token) from the server-sent events.
+        """
+        usage, meta, first_token = {}, {}, None
+        response.encoding = 'utf-8'
+        if echo:
+            sys.stdout.write("  ")
+        for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+            if not line.startswith("data: "):
+                continue
+            if line == "data: [DONE]":
+                break
+            chunk = _loads(line[6:])
+            usage = chunk.get('usage') or usage
+            meta = chunk.get('meta') or meta
+            for choice in chunk.get('choices', []):
+                token = choice.get('delta', {}).get('content')
+                if token:
+                    if first_token is None:
+                        first_token = (time.time() - start) * 1000
+                    if echo:
+                        sys.stdout.write(token.replace('\n', '\n  '))
+                        sys.stdout.flush()
+        if echo:
+            sys.stdout.write("\n")
+        return usage, meta, first_token
+    
+    def _bench_one(self, model, message):
+        """Time one streamed completion without printing it"""
+        start = time.time()
+        with self._post_chat(model, message) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}")
+            if response.headers.get('Content-Type', '').startswith('text/event-stream'):
+                usage, meta, first_token = self._read_stream(response, start, echo=False)
             else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+                data = _loads(response.content)
+                usage, meta, first_token = data.get('usage', {}), data.get('meta', {}), None
+        return first_token, (time.time() - start) * 1000, usage, meta
+    
+    @_api_call("CHAT BENCHMARK")
+    def chat_bench(self, models, message):
+        """Send the same message to several models at once and compare them"""
+        import asyncio
+        import requests
+        
+        sys.stdout.write(
+            f"  Models  : {', '.join(models)}\n"
+            f"  Message : {message[:50]}{'...' if len(message) > 50 else ''}\n\n"
+        )
+        
+        # Each model is timed from its own send, so one queued behind a full pool is not penalised
+        limit = asyncio.Semaphore(POOL_SIZE)
+        
+        async def bench(model):
+            async with limit:
+                return await asyncio.to_thread(self._bench_one, model, message)
+        
+        async def run_all():
+            return await asyncio.gather(*(bench(model) for model in models), return_exceptions=True)
+        
+        # Create the shared session before the workers race to create one each
+        self.session
+        
+        rows = [_BENCH_FMT % ("Model", "TTFT", "Latency", "Tokens", "$/1k tok"),
+                "  " + "-" * 64 + "\n"]
+        failed = 0
+        for model, result in zip(models, asyncio.run(run_all())):
+            if isinstance(result, Exception):
+                failed += 1
+                reason = "cannot connect" if isinstance(result, requests.exceptions.ConnectionError) else result
+                rows.append(f"  {model:<24} failed: {reason}\n")
+                continue
+            first_token, latency, usage, meta = result
+            tokens = usage.get('total_tokens', 0)
+            rows.append(_BENCH_FMT % (
+                model,
+                f"{first_token:.0f}ms" if first_token is not None else "-",
+                f"{latency:.0f}ms",
+                tokens,
+                f"${meta['cost'] / tokens * 1000:.6f}" if tokens and 'cost' in meta else "-",
+            ))
+        sys.stdout.write("".join(rows) + "\n")
+        if failed:
+            self.print_status('warning', f"{failed} of {len(models)} models failed")
+        else:
+            self.print_status('success', f"Benchmarked {len(models)} models")
     
+    @_api_call("CREATE FINE-TUNING JOB")
     def create_job(self, base_model, adapter_name, training_data, adapter_type="lora", epochs=3):
         """Create a fine-tuning job"""
-        self.print_section("CREATE FINE-TUNING JOB")
-        print(f"  Base Model    : {base_model}")
-        print(f"  Adapter Name  : {adapter_name}")
-        print(f"  Adapter Type  : {adapter_type}")
-        print(f"  Training Data : {training_data}")
-        print(f"  Epochs        : {epochs}")
-        print()
+        sys.stdout.write(
+            f"  Base Model    : {base_model}\n"
+            f"  Adapter Name  : {adapter_name}\n"
+            f"  Adapter Type  : {adapter_type}\n"
+            f"  Training Data : {training_data}\n"
+            f"  Epochs        : {epochs}\n\n"
+        )
         
+        payload = {
+            "base_model": base_model,
+            "adapter_name": adapter_name,
+            "adapter_type": adapter_type,
+            "training_data": training_data,
+            "epochs": epochs
+        }
+        
+        response = self.session.post(f"{self.api_base}/v1/fine-tuning/jobs", data=_dumpb(payload),
+                                     headers={'Content-Type': 'application/json'},
+                                     timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code == 200:
+            data = _loads(response.content)
+            self.print_status('success', f"Job created: {data.get('job_id', data.get('id', 'unknown'))}")
+            sys.stdout.write(f"  Status: {data.get('status', 'unknown')}\n"
+                             f"  GPU: {data.get('gpu_type', 'unknown')}\n")
+            return data
+        else:
+            self.print_status('error', f"Failed: {response.text}")
+    
+    @_api_call("JOB PROGRESS")
+    def watch_job(self, job_id, timeout=None):
+        """Redraw a job's progress in place until it finishes or timeout seconds pass,
+        polling 1s, 2s, 4s... apart
+        """
+        sys.stdout.write(f"  Job: {job_id}\n")
+        deadline = time.monotonic() + timeout if timeout else None
+        attempt = 0
         try:
-            payload = {
-                "base_model": base_model,
-                "adapter_name": adapter_name,
-                "adapter_type": adapter_type,
-                "training_data": training_data,
-                "epochs": epochs
-            }
-            
-            response = requests.post(f"{self.api_base}/v1/fine-tuning/jobs", json=payload)
-            
-            if response.status_code == 200:
-                data = response.json()
-                self.print_status('success', f"Job created: {data.get('job_id', 'unknown')}")
-                print(f"  Status: {data.get('status', 'unknown')}")
-                print(f"  GPU: {data.get('gpu_type', 'unknown')}")
-            else:
-                self.print_status('error', f"Failed: {response.text}")
-        except Exception as e:
-            self.print_status('error', f"Error: {str(e)}")
-        self.print_end_section()
+            while True:
+                response = self.session.get(f"{self.api_base}/v1/fine-tuning/jobs/{job_id}",
+                                            timeout=REQUEST_TIMEOUT)
+                if response.status_code != 200:
+                    sys.stdout.write("\n" if attempt else "")
+                    self.print_status('error', f"Failed: {response.text}")
+                    return
+                
+                job = _loads(response.content)['job']
+                filled = int(20 * job['progress'])
+                sys.stdout.write(f"\r  [{'█' * filled}{'░' * (20 - filled)}] "
+                                 f"{job['progress']*100:3.0f}%  {job['status'].upper():<10}")
+                sys.stdout.flush()
+                if job['status'] in _JOB_FINAL_STATUSES:
+                    sys.stdout.write("\n")
+                    return job
+                
+                wait = min(_JOB_POLL_MAX, 2 ** attempt)
+                if deadline is not None:
+                    if time.monotonic() >= deadline:
+                        sys.stdout.write("\n")
+                        self.print_status('warning', f"Still {job['status']} after {timeout}s; the job keeps running")
+                        return job
+                    wait = min(wait, deadline - time.monotonic())
+                time.sleep(max(wait, 0))
+                attempt += 1
+        except KeyboardInterrupt:
+            sys.stdout.write("\n")
+            self.print_status('info', "Stopped watching; the job keeps running")
 
 
-def main():
+# List commands: section title, API path, the method printing the response and how many
+# seconds it may be served from the local cache (None: always live)
+SECTIONS = {
+    'models': ("AVAILABLE MODELS", "/v1/models", '_render_models', 60),
+    'adapters': ("ADAPTERS", "/v1/adapters", '_render_adapters', 30),
+    'gpu': ("GPU POOLS", "/v1/gpu/pools", '_render_gpu_pools', 20),
+    'jobs': ("FINE-TUNING JOBS", _jobs_path(), '_render_jobs', None),
+    'usage': ("USAGE STATISTICS", "/v1/usage", '_render_usage', 10),
+    'metrics': ("REAL-TIME METRICS", "/v1/metrics", '_render_metrics', None),
+}
+
+
+@functools.cache
+def _build_parser():
     parser = argparse.ArgumentParser(
         description='Vajra LLM Platform CLI',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -344,11 +697,17 @@ Examples:
   vajra-llm-cli.py jobs                List fine-tuning jobs
   vajra-llm-cli.py usage               Show usage statistics
   vajra-llm-cli.py metrics             Show real-time metrics
+  vajra-llm-cli.py dashboard           Show all of the above at once
   vajra-llm-cli.py chat llama-3.1-8b "Hello, how are you?"
   vajra-llm-cli.py create-job llama-3.1-8b my-adapter gs://data.jsonl
         """
     )
     
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the local response cache')
+    parser.add_argument('--refresh', action='store_true', help='Fetch cached views from the API again')
+    parser.add_argument('--verbose', action='store_true', help='Log connections and retries to stderr')
+    parser.add_argument('--no-banner', action='store_true', help='Do not print the banner')
+    
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
     # Health check
@@ -364,7 +723,9 @@ Examples:
     subparsers.add_parser('gpu', help='Show GPU pools')
     
     # Fine-tuning jobs
-    subparsers.add_parser('jobs', help='List fine-tuning jobs')
+    jobs_parser = subparsers.add_parser('jobs', help='List fine-tuning jobs')
+    jobs_parser.add_argument('--limit', type=int, default=_JOB_PAGE_SIZE, help=f'Most jobs to list (default: {_JOB_PAGE_SIZE})')
+    jobs_parser.add_argument('--all', action='store_true', help='List every job')
     
     # Usage
     subparsers.add_parser('usage', help='Show usage statistics')
@@ -372,11 +733,21 @@ Examples:
     # Metrics
     subparsers.add_parser('metrics', help='Show real-time metrics')
     
+    # Dashboard
+    subparsers.add_parser('dashboard', help='Show every list view, fetched in parallel')
+    
     # Chat
     chat_parser = subparsers.add_parser('chat', help='Send chat completion')
     chat_parser.add_argument('model', help='Model ID (e.g., llama-3.1-8b)')
     chat_parser.add_argument('message', help='Message to send')
     chat_parser.add_argument('--adapter', help='Adapter to use')
+    chat_parser.add_argument('--no-stream', action='store_true', help='Wait for the whole completion instead of streaming it')
+    
+    # Chat benchmark
+    bench_parser = subparsers.add_parser('chat-bench', help='Send the same message to several models in parallel')
+    bench_parser.add_argument('message', help='Message to send')
+    bench_parser.add_argument('--models', required=True, type=lambda value: [m.strip() for m in value.split(',') if m.strip()],
+                              help='Comma-separated model IDs (e.g., llama-3.1-8b,mistral-7b)')
     
     # Create job
     job_parser = subparsers.add_parser('create-job', help='Create fine-tuning job')
@@ -385,41 +756,58 @@ Examples:
     job_parser.add_argument('training_data', help='GCS path to training data')
     job_parser.add_argument('--type', default='lora', choices=['lora', 'qlora'], help='Adapter type')
     job_parser.add_argument('--epochs', type=int, default=3, help='Number of epochs')
+    job_parser.add_argument('--watch', action='store_true', help='Follow the job until it finishes')
+    job_parser.add_argument('--watch-timeout', type=float, metavar='SECONDS', help='Stop watching after this long')
     
+    return parser
+
+
+def _create_job(cli, args):
+    job = cli.create_job(args.base_model, args.adapter_name, args.training_data, args.type, args.epochs)
+    if job and args.watch:
+        cli.watch_job(job.get('job_id', job.get('id')), args.watch_timeout)
+
+
+COMMANDS = {
+    'health': lambda cli, args: cli.health_check(),
+    'models': lambda cli, args: cli.list_models(),
+    'adapters': lambda cli, args: cli.list_adapters(),
+    'gpu': lambda cli, args: cli.list_gpu_pools(),
+    'jobs': lambda cli, args: cli.list_jobs(None if args.all else args.limit),
+    'usage': lambda cli, args: cli.get_usage(),
+    'metrics': lambda cli, args: cli.get_metrics(),
+    'dashboard': lambda cli, args: cli.dashboard(),
+    'chat': lambda cli, args: cli.chat(args.model, args.message, args.adapter, not args.no_stream),
+    'chat-bench': lambda cli, args: cli.chat_bench(args.models, args.message),
+    'create-job': _create_job,
+}
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
     
-    cli = VajraLLMCLI()
+    if args.verbose:
+        import logging
+        logging.basicConfig(format="  [HTTP] %(message)s")
+        logging.getLogger("urllib3").setLevel(logging.DEBUG)
     
-    if args.command == 'health':
-        cli.print_banner()
-        cli.health_check()
-    elif args.command == 'models':
-        cli.print_banner()
-        cli.list_models()
-    elif args.command == 'adapters':
-        cli.print_banner()
-        cli.list_adapters()
-    elif args.command == 'gpu':
-        cli.print_banner()
-        cli.list_gpu_pools()
-    elif args.command == 'jobs':
-        cli.print_banner()
-        cli.list_jobs()
-    elif args.command == 'usage':
-        cli.print_banner()
-        cli.get_usage()
-    elif args.command == 'metrics':
-        cli.print_banner()
-        cli.get_metrics()
-    elif args.command == 'chat':
-        cli.print_banner()
-        cli.chat(args.model, args.message, args.adapter)
-    elif args.command == 'create-job':
-        cli.print_banner()
-        cli.create_job(args.base_model, args.adapter_name, args.training_data, args.type, args.epochs)
-    else:
+    cli = VajraLLMCLI()
+    cli.use_cache = not args.no_cache
+    cli.refresh = args.refresh
+    # Overlap the command's round trip with writing the banner
+    if args.command == 'health' or args.command in SECTIONS:
+        cli.prefetch(args.command,
+                     _jobs_path(None if args.all else args.limit) if args.command == 'jobs' else None)
+    # Piped output is for other tools, not people
+    if not (args.no_banner or os.environ.get("VAJRA_NO_BANNER")) and sys.stdout.isatty():
         cli.print_banner()
+    
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
+        return
+    handler(cli, args)
 
 
 if __name__ == "__main__":